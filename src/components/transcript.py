@@ -6,7 +6,10 @@ speaker diarization, keyword search with highlighting, and metadata panel.
 
 import logging
 import re
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import dash_bootstrap_components as dbc
@@ -15,7 +18,7 @@ from dash import Input, Output, State, callback, dcc, html
 from src.db.session import get_session
 from src.models import ProcessingStatus
 from src.services.recording import get_recording
-from src.services.transcript import search_transcript
+from src.services.transcript import search_transcripts
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +44,7 @@ STATUS_LABELS = {
 
 # 10-color accessible palette for multi-speaker support
 # Material Design 100-level colors for good contrast with dark text
-SPEAKER_PALETTE = [
+SPEAKER_PALETTE = (
     {"backgroundColor": "#e3f2fd", "name": "Light Blue"},  # 0: Interviewer
     {"backgroundColor": "#f5f5f5", "name": "Light Gray"},  # 1: Respondent
     {"backgroundColor": "#e8f5e9", "name": "Light Green"},  # 2: Extended palette
@@ -52,7 +55,9 @@ SPEAKER_PALETTE = [
     {"backgroundColor": "#e0f7fa", "name": "Light Cyan"},  # 7: Extended palette
     {"backgroundColor": "#f9fbe7", "name": "Light Lime"},  # 8: Extended palette
     {"backgroundColor": "#fff3e0", "name": "Light Orange"},  # 9: Extended palette
-]
+)
+# Palette background colors alone, for style lookups by index
+_SPEAKER_BG_COLORS = tuple(entry["backgroundColor"] for entry in SPEAKER_PALETTE)
 
 # Fixed color assignments for backward compatibility
 FIXED_SPEAKER_COLORS = {
@@ -60,6 +65,17 @@ FIXED_SPEAKER_COLORS = {
     "respondent": 1,  # Light Gray
 }
 
+# Digit directly after a non-space, non-digit character ("Respondent2")
+_SPEAKER_NUMBER_RE = re.compile(r"([^\s\d])(\d)")
+
+# Speaker turn with optional timestamp: "SPEAKER_XX: [timestamp] text" or "Speaker: text"
+# Includes numbered respondents (Respondent1, Respondent2, etc.)
+_SPEAKER_TURN_RE = re.compile(
+    r"^(SPEAKER_\d+|Interviewer|Respondent\d*|Speaker\s*\d*):"
+    r"\s*(?:\[([^\]]+)\])?\s*(.*)$",
+    re.IGNORECASE,
+)
+
 
 def get_speaker_color_index(speaker_label: str) -> int:
     """Get deterministic color index for a speaker label.
@@ -73,8 +89,16 @@ def get_speaker_color_index(speaker_label: str) -> int:
     Returns:
         Index into SPEAKER_PALETTE (0-9).
     """
-    label_lower = speaker_label.lower()
+    return _color_index_for_label(speaker_label.lower())
 
+
+@lru_cache(maxsize=256)
+def _color_index_for_label(label_lower: str) -> int:
+    """Compute the palette index for an already lowercased speaker label.
+
+    Cached on the normalized label, so "Respondent2" and "RESPONDENT2" share
+    one entry and repeated lookups while rendering a transcript are free.
+    """
     # Check for fixed speaker colors (backward compatibility)
     if label_lower in FIXED_SPEAKER_COLORS:
         return FIXED_SPEAKER_COLORS[label_lower]
@@ -87,6 +111,7 @@ def get_speaker_color_index(speaker_label: str) -> int:
     return 2 + (hash_value % (len(SPEAKER_PALETTE) - 2))
 
 
+@lru_cache(maxsize=128)
 def format_speaker_label(speaker_label: str) -> str:
     """Format speaker label for display (add space before numbers).
 
@@ -96,9 +121,21 @@ def format_speaker_label(speaker_label: str) -> str:
     Returns:
         Formatted label with space before numbers (e.g., "Respondent 2").
     """
-    # Add space before digit if preceded by a non-digit, non-space character
-    # Uses negative lookbehind to skip if there's already a space before the digit
-    return re.sub(r"([^\s\d])(\d)", r"\1 \2", speaker_label)
+    # Fast path: labels are usually a name with at most one trailing number
+    split = len(speaker_label)
+    while split > 0 and speaker_label[split - 1].isdecimal():
+        split -= 1
+    if split == 0 or split == len(speaker_label) or speaker_label[split - 1].isspace():
+        if not any(c.isdecimal() for c in speaker_label[:split]):
+            return speaker_label
+    else:
+        head = speaker_label[:split]
+        if not any(c.isdecimal() for c in head):
+            return f"{head} {speaker_label[split:]}"
+
+    # Add space before digit if preceded by a non-digit, non-space character,
+    # so labels that already have a space before the digit are left alone
+    return _SPEAKER_NUMBER_RE.sub(r"\1 \2", speaker_label)
 
 
 def get_speaker_style(speaker_label: str) -> dict:
@@ -109,12 +146,23 @@ def get_speaker_style(speaker_label: str) -> dict:
 
     Returns:
         Style dict with backgroundColor, textAlign, marginLeft, marginRight.
+        Each call returns a new dict, so callers may pass or modify it freely.
     """
-    index = get_speaker_color_index(speaker_label)
-    base_style = {"backgroundColor": SPEAKER_PALETTE[index]["backgroundColor"]}
+    return dict(_speaker_style_for_label(speaker_label.lower()))
+
+
+@lru_cache(maxsize=64)
+def _speaker_style_for_label(label_lower: str) -> Mapping[str, str]:
+    """Build the cached, read-only style for an already lowercased speaker label.
+
+    Dash cannot serialize the returned mappingproxy, so it must be copied into
+    a dict (or spread into one) before it is passed as a component style.
+    """
+    index = _color_index_for_label(label_lower)
+    base_style = {"backgroundColor": _SPEAKER_BG_COLORS[index]}
 
     # Position: Interviewer left-aligned, others right-aligned
-    if speaker_label.lower() == "interviewer":
+    if label_lower == "interviewer":
         base_style.update(
             {
                 "marginRight": "20%",
@@ -131,7 +179,7 @@ def get_speaker_style(speaker_label: str) -> dict:
             }
         )
 
-    return base_style
+    return MappingProxyType(base_style)
 
 
 # Legacy speaker styling configuration (deprecated, use get_speaker_style instead)
@@ -272,14 +320,6 @@ def _parse_speaker_turns(diarized_text: str) -> list[dict]:
 
     turns = []
 
-    # Pattern to match speaker turns with optional timestamps
-    # Matches: "SPEAKER_XX: [timestamp] text" or "Speaker: text"
-    # Includes numbered respondents (Respondent1, Respondent2, etc.)
-    pattern = (
-        r"^(SPEAKER_\d+|Interviewer|Respondent\d*|Speaker\s*\d*):"
-        r"\s*(?:\[([^\]]+)\])?\s*(.*)$"
-    )
-
     # Split by lines and process
     lines = diarized_text.strip().split("\n")
     current_turn = None
@@ -289,7 +329,8 @@ def _parse_speaker_turns(diarized_text: str) -> list[dict]:
         if not line:
             continue
 
-        match = re.match(pattern, line, re.IGNORECASE)
+        # A line without a colon cannot start a turn, so skip the regex for it
+        match = _SPEAKER_TURN_RE.match(line) if ":" in line else None
         if match:
             # Save previous turn if exists
             if current_turn:
@@ -347,13 +388,8 @@ def _create_speaker_legend(dialog_json: list[dict]) -> html.Div | None:
         return None
 
     # Extract unique speakers in order of first appearance
-    seen = set()
-    speakers = []
-    for turn in dialog_json:
-        speaker = turn.get("speaker", "")
-        if speaker and speaker not in seen:
-            seen.add(speaker)
-            speakers.append(speaker)
+    unique_speakers = dict.fromkeys(turn.get("speaker", "") for turn in dialog_json)
+    speakers = [speaker for speaker in unique_speakers if speaker]
 
     if not speakers:
         return None
@@ -361,7 +397,7 @@ def _create_speaker_legend(dialog_json: list[dict]) -> html.Div | None:
     # Create legend items (color swatch + label)
     legend_items = []
     for speaker in speakers:
-        style = get_speaker_style(speaker)
+        style = _speaker_style_for_label(speaker.lower())
         display_label = format_speaker_label(speaker)
 
         legend_items.append(
@@ -429,8 +465,8 @@ def _create_speaker_block(
         A styled Card component for the speaker turn.
     """
     speaker_label = turn.get("speaker", "Unknown")
-    # Use new multi-speaker style system
-    style = get_speaker_style(speaker_label)
+    # Use new multi-speaker style system; the cached style is spread into the card below
+    style = _speaker_style_for_label(speaker_label.lower())
 
     # Apply highlighting if search query provided (XSS-safe)
     text = turn.get("text", "")
@@ -924,9 +960,8 @@ def filter_transcript(
     total_matches = 0
     matching_turns = []
 
-    for turn in turns:
-        text = turn.get("text", "")
-        matches = search_transcript(text, search_query)
+    turn_texts = ((turn, turn.get("text", "")) for turn in turns)
+    for turn, matches in search_transcripts(turn_texts, search_query):
         if matches:
             total_matches += len(matches)
             matching_turns.append(turn)
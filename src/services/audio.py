@@ -12,10 +12,16 @@ import io
 import json
 import logging
 import math
+import struct
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, BinaryIO
 
-import librosa
+import numpy as np
 import soundfile as sf
+import soxr
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.config import Config
 
@@ -26,11 +32,24 @@ logger = logging.getLogger(__name__)
 # Speaker embedding matching threshold (0.75 per spec)
 SPEAKER_SIMILARITY_THRESHOLD = 0.75
 
+# Audio accepted by convert_to_wav: an in-memory buffer or a readable binary file
+AudioInput = bytes | bytearray | memoryview | BinaryIO
+
 # Constants
-ALLOWED_FORMATS = {".mp3", ".wav", ".m4a", ".flac"}
+ALLOWED_FORMATS = frozenset({".mp3", ".wav", ".m4a", ".flac"})
+_ALLOWED_FORMATS_DISPLAY = ", ".join(sorted(ALLOWED_FORMATS))
+_INVALID_EXTENSION_MSG = (
+    "Invalid format: '.%s' is not supported. Allowed formats: " + _ALLOWED_FORMATS_DISPLAY
+)
 MAX_FILE_SIZE = 500 * 1024 * 1024  # 500MB in bytes
 TARGET_SAMPLE_RATE = 16000  # 16kHz
 CHUNK_DURATION_SECONDS = 60  # 60-second chunks for diarization
+WAV_HEADER_SIZE = 44  # Canonical RIFF/WAVE header for PCM data
+
+# RIFF header, fmt chunk and data chunk header for PCM WAV, compiled once
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_RIFF_CHUNK_SIZE = struct.Struct("<I")
+_WAV_FMT_CHUNK = struct.Struct("<HHIIHH")
 
 # Databricks endpoint size limits
 MAX_REQUEST_SIZE_BYTES = 16_777_216  # 16MB Databricks endpoint limit
@@ -39,6 +58,30 @@ BASE64_OVERHEAD_RATIO = 4 / 3  # Base64 increases size by ~33%
 MAX_RAW_AUDIO_BYTES = int(MAX_REQUEST_SIZE_BYTES / BASE64_OVERHEAD_RATIO * 0.95)
 
 
+def __getattr__(name: str) -> Any:
+    """Import librosa on first access.
+
+    librosa pulls in numba and its JIT machinery, which is expensive at worker
+    start-up and unnecessary for paths such as validate_file_format. The module
+    is cached in globals() after the first import, so this runs at most once.
+    """
+    if name == "librosa":
+        import librosa
+
+        globals()["librosa"] = librosa
+        return librosa
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_librosa() -> ModuleType:
+    """Return the librosa module, importing it if needed.
+
+    Looks in globals() first so patches applied to this module's ``librosa``
+    attribute are honoured.
+    """
+    return globals().get("librosa") or __getattr__("librosa")
+
+
 class AudioValidationError(Exception):
     """Exception raised for audio file validation errors.
 
@@ -46,7 +89,7 @@ class AudioValidationError(Exception):
     such as invalid format, incorrect file size, or missing filename.
     """
 
-    pass
+    __slots__ = ()
 
 
 class AudioProcessingError(Exception):
@@ -56,7 +99,7 @@ class AudioProcessingError(Exception):
     such as format conversion, duration extraction, or invalid audio data.
     """
 
-    pass
+    __slots__ = ()
 
 
 @dataclass
@@ -78,6 +121,29 @@ class DiarizeResponse:
     error: str | None
 
 
+@lru_cache(maxsize=128)
+def _is_allowed_extension(extension: str) -> bool:
+    """Check a raw (un-normalized, dot-less) extension against ALLOWED_FORMATS.
+
+    Cached on the raw string so repeated uploads with the same extension skip
+    the lowercase normalization entirely.
+
+    Args:
+        extension: File extension without the leading dot, in any case.
+
+    Returns:
+        True if the extension is an allowed audio format.
+    """
+    if not extension.islower():
+        extension = extension.lower()
+    return "." + extension in ALLOWED_FORMATS
+
+
+# Warm the cache with the canonical lowercase extensions
+for _extension in ALLOWED_FORMATS:
+    _is_allowed_extension(_extension[1:])
+
+
 def validate_file_format(filename: str, file_size: int) -> bool:
     """Validate an audio file's format and size.
 
@@ -96,21 +162,20 @@ def validate_file_format(filename: str, file_size: int) -> bool:
     if not filename:
         raise AudioValidationError("Empty filename is not allowed")
 
+    name, separator, extension = filename.rpartition(".")
+
     # Check for filename with only extension (no actual name)
-    if filename.startswith(".") and filename.count(".") == 1:
+    if separator and not name:
         raise AudioValidationError("Invalid filename: name cannot be only an extension")
 
-    # Extract and validate the file extension
-    if "." not in filename:
+    # Validate the file extension
+    if not separator:
         raise AudioValidationError(
-            f"Invalid format: file has no extension. Allowed formats: {ALLOWED_FORMATS}"
+            f"Invalid format: file has no extension. Allowed formats: {_ALLOWED_FORMATS_DISPLAY}"
         )
 
-    extension = "." + filename.rsplit(".", 1)[-1].lower()
-    if extension not in ALLOWED_FORMATS:
-        raise AudioValidationError(
-            f"Invalid format: '{extension}' is not supported. Allowed formats: {ALLOWED_FORMATS}"
-        )
+    if not _is_allowed_extension(extension):
+        raise AudioValidationError(_INVALID_EXTENSION_MSG % extension.lower())
 
     # Validate file size
     if file_size <= 0:
@@ -125,11 +190,198 @@ def validate_file_format(filename: str, file_size: int) -> bool:
     return True
 
 
-def convert_to_wav(audio_bytes: bytes) -> tuple[bytes, float]:
+def _decode_audio(audio_data: AudioInput) -> tuple[np.ndarray, int]:
+    """Decode audio data into a float32 sample array.
+
+    libsndfile handles WAV, FLAC and MP3 natively. Formats it cannot decode
+    (e.g. M4A/AAC) fall back to librosa's audioread-based loader.
+
+    Args:
+        audio_data: Audio in any supported format, as a bytes-like buffer or
+            a seekable binary file object. File objects are read in place
+            rather than being loaded into memory first.
+
+    Returns:
+        A tuple of (samples, sample_rate). Multi-channel audio is returned
+        channels-first with shape (channels, frames).
+    """
+    audio_file = audio_data if hasattr(audio_data, "read") else io.BytesIO(audio_data)
+    start = audio_file.tell()
+
+    try:
+        audio_array, sample_rate = sf.read(audio_file, dtype="float32", always_2d=False)
+    except sf.LibsndfileError:
+        logger.debug("libsndfile cannot decode input, falling back to librosa")
+        audio_file.seek(start)
+        return _get_librosa().load(audio_file, sr=None, mono=False)
+
+    # soundfile returns (frames, channels); match librosa's channels-first layout
+    if audio_array.ndim > 1:
+        audio_array = audio_array.T
+
+    return audio_array, sample_rate
+
+
+@lru_cache(maxsize=1)
+def _get_cuda_resampler() -> tuple[Any, Any] | None:
+    """Return torch and torchaudio's resample function if a CUDA device is usable.
+
+    torch is not an app dependency; this only activates on GPU runtimes that
+    ship it. The import is deferred to first use so CPU workers never pay for it.
+
+    Returns:
+        A (torch, resample) tuple, or None if torchaudio or CUDA is unavailable.
+    """
+    try:
+        import torch
+        from torchaudio.functional import resample
+    except ImportError:
+        return None
+
+    if not torch.cuda.is_available():
+        return None
+
+    return torch, resample
+
+
+def _resample_audio(audio_array: np.ndarray, source_sr: int) -> np.ndarray:
+    """Resample mono 16-bit PCM audio to TARGET_SAMPLE_RATE.
+
+    Runs on the GPU via torchaudio when CUDA is available. Otherwise calls
+    soxr directly (the backend librosa.resample uses by default), which
+    avoids librosa's dispatch overhead on the conversion hot path. soxr
+    resamples int16 natively, so the buffers moving through it are half the
+    size of float32.
+
+    Args:
+        audio_array: 1-D int16 array of samples.
+        source_sr: Sample rate of audio_array in Hz.
+
+    Returns:
+        Resampled 1-D int16 array at TARGET_SAMPLE_RATE.
+    """
+    cuda_resampler = _get_cuda_resampler()
+    if cuda_resampler is not None:
+        torch, resample = cuda_resampler
+        # Pinned host memory lets the host-to-device copy run asynchronously
+        tensor = torch.from_numpy(np.ascontiguousarray(audio_array)).pin_memory()
+        tensor = tensor.to("cuda", non_blocking=True).float()
+        resampled = resample(tensor, source_sr, TARGET_SAMPLE_RATE)
+        return resampled.round_().clamp_(-32768, 32767).to(torch.int16).cpu().numpy()
+
+    return soxr.resample(audio_array, source_sr, TARGET_SAMPLE_RATE, quality="HQ")
+
+
+def _downmix_to_mono(audio_array: np.ndarray) -> np.ndarray:
+    """Average multi-channel audio down to mono in place.
+
+    The first channel's row is reused as the accumulator, so no second
+    full-length sample buffer is allocated. The input array is modified.
+
+    Args:
+        audio_array: Float array with shape (channels, frames).
+
+    Returns:
+        1-D view of the first channel holding the mono mix.
+    """
+    mono = audio_array[0]
+    for channel in audio_array[1:]:
+        np.add(mono, channel, out=mono)
+    mono *= 1.0 / audio_array.shape[0]
+    return mono
+
+
+@lru_cache(maxsize=1)
+def _get_pcm16_kernel() -> Callable[[np.ndarray, np.ndarray], None] | None:
+    """Return the numba kernel that scales, clips and casts samples in one pass.
+
+    numba ships with librosa but the kernel module is imported here lazily so
+    that workers which never convert audio do not pay its import cost. The
+    kernel is compiled with cache=True, so only the first process to see a
+    given input dtype compiles it; later workers load it from numba's cache.
+
+    Returns:
+        A kernel taking (samples, out) that fills the int16 out array, or None
+        if numba is not installed.
+    """
+    try:
+        from src.services.audio_kernels import pack_pcm16
+    except ImportError:
+        return None
+    return pack_pcm16
+
+
+def _to_pcm16(audio_array: np.ndarray) -> np.ndarray:
+    """Quantize float samples to 16-bit PCM.
+
+    Uses a fused numba kernel when available, which reads the input once and
+    writes int16 directly. Otherwise falls back to numpy ufuncs, which take
+    three passes over the buffer.
+
+    Args:
+        audio_array: 1-D array of float samples in the range [-1.0, 1.0].
+
+    Returns:
+        1-D int16 array of samples scaled to the full PCM16 range.
+    """
+    kernel = _get_pcm16_kernel()
+    if kernel is not None:
+        pcm = np.empty(audio_array.shape[0], dtype=np.int16)
+        kernel(audio_array, pcm)
+        return pcm
+
+    # Scale and clip in place in one scratch buffer. These ufuncs run numpy's
+    # SIMD loops over the whole array; do not rewrite as a per-sample loop.
+    scratch = np.empty_like(audio_array, dtype=np.float32)
+    np.multiply(audio_array, 32767.0, out=scratch)
+    np.clip(scratch, -32768.0, 32767.0, out=scratch)
+    return scratch.astype(np.int16)
+
+
+def _encode_wav(pcm: np.ndarray, sample_rate: int) -> bytes:
+    """Encode mono 16-bit PCM samples as a WAV file.
+
+    Allocates the output once, packs the 44-byte RIFF header into it and
+    copies the samples straight into the data region, so the only other copy
+    is the final conversion to immutable bytes.
+
+    Args:
+        pcm: 1-D int16 array of samples.
+        sample_rate: Sample rate in Hz.
+
+    Returns:
+        Complete WAV file contents.
+    """
+    data_size = pcm.size * 2
+    wav_buffer = bytearray(WAV_HEADER_SIZE + data_size)
+    _WAV_HEADER.pack_into(
+        wav_buffer,
+        0,
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM format
+        1,  # mono
+        sample_rate,
+        sample_rate * 2,  # byte rate
+        2,  # block align
+        16,  # bits per sample
+        b"data",
+        data_size,
+    )
+    np.copyto(np.frombuffer(wav_buffer, dtype="<i2", offset=WAV_HEADER_SIZE), pcm)
+    return bytes(wav_buffer)
+
+
+def convert_to_wav(audio_bytes: AudioInput) -> tuple[bytes, float]:
     """Convert audio data to 16kHz WAV format.
 
     Args:
-        audio_bytes: Raw audio data in any supported format.
+        audio_bytes: Audio data in any supported format. Accepts bytes-like
+            buffers or a seekable binary file object, so large uploads can be
+            streamed from disk instead of being read into memory first.
 
     Returns:
         A tuple containing:
@@ -139,32 +391,28 @@ def convert_to_wav(audio_bytes: bytes) -> tuple[bytes, float]:
     Raises:
         AudioProcessingError: If the audio data is empty or cannot be processed.
     """
-    if not audio_bytes:
+    if not hasattr(audio_bytes, "read") and not audio_bytes:
         raise AudioProcessingError("Cannot process empty audio data")
 
     try:
-        # Load audio from bytes using librosa
-        audio_file = io.BytesIO(audio_bytes)
-        audio_array, source_sr = librosa.load(audio_file, sr=None, mono=False)
+        audio_array, source_sr = _decode_audio(audio_bytes)
 
-        # Handle stereo audio - convert to mono
+        # Handle multi-channel audio - average channels down to mono
         if audio_array.ndim > 1:
-            audio_array = librosa.to_mono(audio_array)
+            audio_array = _downmix_to_mono(audio_array)
+
+        # Quantize before resampling so the resampler moves 2-byte samples
+        pcm = _to_pcm16(audio_array)
+        del audio_array
 
         # Resample to target sample rate if necessary
         if source_sr != TARGET_SAMPLE_RATE:
-            audio_array = librosa.resample(
-                audio_array, orig_sr=source_sr, target_sr=TARGET_SAMPLE_RATE
-            )
+            pcm = _resample_audio(pcm, source_sr)
 
         # Calculate duration based on resampled array
-        duration_seconds = float(len(audio_array) / TARGET_SAMPLE_RATE)
+        duration_seconds = float(len(pcm) / TARGET_SAMPLE_RATE)
 
-        # Write to WAV format
-        wav_buffer = io.BytesIO()
-        sf.write(wav_buffer, audio_array, TARGET_SAMPLE_RATE, format="WAV")
-        wav_buffer.seek(0)
-        wav_bytes = wav_buffer.read()
+        wav_bytes = _encode_wav(pcm, TARGET_SAMPLE_RATE)
 
         return wav_bytes, duration_seconds
 
@@ -173,6 +421,52 @@ def convert_to_wav(audio_bytes: bytes) -> tuple[bytes, float]:
         raise AudioProcessingError(f"Failed to process audio: {e}") from e
 
 
+def _parse_header_duration(audio_bytes: bytes) -> float | None:
+    """Read the duration of WAV or FLAC data from its header.
+
+    Args:
+        audio_bytes: Raw audio data.
+
+    Returns:
+        Duration in seconds, or None if the data is not WAV/FLAC or the
+        header does not carry enough information.
+    """
+    if audio_bytes[:4] == b"RIFF" and audio_bytes[8:12] == b"WAVE":
+        byte_rate = 0
+        offset = 12
+        while offset + 8 <= len(audio_bytes):
+            chunk_id = audio_bytes[offset : offset + 4]
+            (chunk_size,) = _RIFF_CHUNK_SIZE.unpack_from(audio_bytes, offset + 4)
+            if chunk_id == b"fmt " and chunk_size >= 16:
+                _, _, _, byte_rate, _, _ = _WAV_FMT_CHUNK.unpack_from(audio_bytes, offset + 8)
+            elif chunk_id == b"data":
+                if not byte_rate:
+                    return None
+                # Streamed or unfinalized writers leave the size as 0 or 0xFFFFFFFF;
+                # treat those as unknown and use the payload length instead
+                payload_size = len(audio_bytes) - offset - 8
+                if chunk_size in (0, 0xFFFFFFFF):
+                    data_size = payload_size
+                else:
+                    data_size = min(chunk_size, payload_size)
+                return data_size / byte_rate
+            # Chunks are word-aligned
+            offset += 8 + chunk_size + (chunk_size & 1)
+        return None
+
+    if audio_bytes[:4] == b"fLaC" and len(audio_bytes) >= 26 and audio_bytes[4] & 0x7F == 0:
+        # STREAMINFO body starts at byte 8; bytes 10-17 pack
+        # sample rate (20 bits), channels (3), bits per sample (5), total samples (36)
+        packed = int.from_bytes(audio_bytes[18:26], "big")
+        sample_rate = packed >> 44
+        total_samples = packed & ((1 << 36) - 1)
+        if not sample_rate or not total_samples:
+            return None
+        return total_samples / sample_rate
+
+    return None
+
+
 def get_audio_duration(audio_bytes: bytes) -> float:
     """Get the duration of audio data in seconds.
 
@@ -189,8 +483,13 @@ def get_audio_duration(audio_bytes: bytes) -> float:
         raise AudioProcessingError("Cannot get duration of empty audio data")
 
     try:
+        # WAV and FLAC store enough in their headers to skip decoding entirely
+        duration = _parse_header_duration(audio_bytes)
+        if duration is not None:
+            return duration
+
         audio_file = io.BytesIO(audio_bytes)
-        duration = librosa.get_duration(path=audio_file)
+        duration = _get_librosa().get_duration(path=audio_file)
         return duration
     except Exception as e:
         logger.error(f"Failed to get audio duration: {e}", exc_info=True)
@@ -219,7 +518,7 @@ def split_audio_into_chunks(
     try:
         # Load the WAV audio
         audio_file = io.BytesIO(wav_bytes)
-        audio_array, sample_rate = librosa.load(audio_file, sr=None, mono=True)
+        audio_array, sample_rate = _get_librosa().load(audio_file, sr=None, mono=True)
 
         # Calculate samples per chunk
         samples_per_chunk = chunk_duration * sample_rate
@@ -265,7 +564,7 @@ def _calculate_max_chunk_duration(wav_bytes: bytes) -> int | None:
 
     # Calculate bytes per second from the audio
     audio_file = io.BytesIO(wav_bytes)
-    audio_array, sample_rate = librosa.load(audio_file, sr=None, mono=True)
+    audio_array, sample_rate = _get_librosa().load(audio_file, sr=None, mono=True)
     duration_seconds = len(audio_array) / sample_rate
     bytes_per_second = total_size / duration_seconds
 
@@ -0,0 +1,38 @@
+"""Compiled numba kernels for the audio service.
+
+This module imports numba at load time, so src.services.audio only imports it
+on first use and workers that never convert audio do not pay for numba. The
+kernels are defined at module level so numba can cache their compiled code
+on disk and reuse it across worker processes.
+
+Kernels are compiled without parallel=True. convert_to_wav runs on one thread
+per upload, and numba's default workqueue threading layer aborts the process
+when parallel kernels are entered from several threads at once. These kernels
+are memory-bound, so a serial loop loses nothing.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def pack_pcm16(samples: np.ndarray, out: np.ndarray) -> None:
+    """Scale, clip and cast float samples to int16 in one pass.
+
+    Matches the numpy path in _to_pcm16 sample for sample: the scaled value
+    is rounded to float32, clipped, then truncated toward zero. NaN samples
+    are written as silence.
+
+    Args:
+        samples: 1-D array of float samples in the range [-1.0, 1.0].
+        out: 1-D int16 array of the same length, filled in place.
+    """
+    for i in range(samples.shape[0]):
+        value = np.float32(samples[i] * 32767.0)
+        if value > 32767.0:
+            value = np.float32(32767.0)
+        elif value < -32768.0:
+            value = np.float32(-32768.0)
+        elif value != value:
+            value = np.float32(0.0)
+        out[i] = np.int16(value)
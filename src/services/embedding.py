@@ -6,10 +6,13 @@ storing chunks in the database, and performing similarity search for RAG.
 
 import logging
 import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import numpy as np
 from databricks_langchain import DatabricksEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from sqlalchemy import text
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
 
 from src.config import get_settings
@@ -17,6 +20,21 @@ from src.models import Recording, TranscriptChunk
 
 logger = logging.getLogger(__name__)
 
+# Speaker label written by chunk_dialog: "[Speaker]: text..."
+_SPEAKER_LABEL_RE = re.compile(r"\[(\w+)\]:")
+# Labels longer than this bypass the label cache
+_MAX_SPEAKER_LABEL_LEN = 64
+# ASCII whitespace/control characters are word boundaries in chunk_transcript
+_CONTROL_CHARS = "".join(map(chr, range(0x20)))
+_NON_SPACE_RE = re.compile(r"[^ ]")
+# Legacy timestamped label: "[Interviewer 0:00:00]" or "[Respondent 1:30:45]"
+_LEGACY_SPEAKER_RE = re.compile(r"\[(Interviewer|Respondent)\s+\d+:\d+:\d+\]")
+# Chunk counts at or above this are stored with a bulk INSERT instead of ORM objects
+_BULK_INSERT_MIN_ROWS = 100
+# Texts per embed_documents request, and how many requests may be in flight at once
+_EMBED_BATCH_SIZE = 32
+_EMBED_MAX_WORKERS = 4
+
 
 class EmbeddingError(Exception):
     """Exception raised for errors during embedding operations."""
@@ -24,6 +42,86 @@ class EmbeddingError(Exception):
     pass
 
 
+def _validate_chunk_params(chunk_size: int, overlap: int) -> None:
+    """Validate chunking parameters shared by chunk_transcript and chunk_dialog.
+
+    Raises:
+        ValueError: If chunk_size <= 0, overlap < 0, or overlap >= chunk_size.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if overlap < 0:
+        raise ValueError("overlap must be non-negative")
+    if overlap >= chunk_size:
+        raise ValueError("overlap must be less than chunk_size")
+
+
+def _boundary_text(text: str) -> str:
+    """Return text with every ASCII control character (newline, tab, ...) made a space.
+
+    Word boundaries are then always " ", so they can be found with
+    str.find/str.rfind, which run as C-level scans. Each replacement is a
+    memchr-style scan that is skipped when the character is absent.
+    """
+    scan = text
+    for char in _CONTROL_CHARS:
+        if char in scan:
+            scan = scan.replace(char, " ")
+    return scan
+
+
+def _split_range(
+    text: str,
+    scan: str,
+    lo: int,
+    hi: int,
+    chunk_size: int,
+    overlap: int,
+) -> Iterator[str]:
+    """Yield overlapping, word-aligned chunks of text[lo:hi].
+
+    Boundaries are found with C-level find/rfind scans over scan (the output
+    of _boundary_text for text) rather than a character-by-character loop.
+
+    Args:
+        text: The full text being chunked.
+        scan: _boundary_text(text), used to locate word boundaries.
+        lo: Start offset of the range to chunk.
+        hi: End offset (exclusive) of the range to chunk.
+        chunk_size: Maximum size of each chunk in characters.
+        overlap: Number of overlapping characters between chunks.
+
+    Yields:
+        Stripped, non-empty chunks in order.
+    """
+    start = lo
+    while start < hi:
+        # Skip any whitespace run so chunks start on a word (or a hard-split remainder)
+        if scan[start] == " ":
+            word = _NON_SPACE_RE.search(scan, start, hi)
+            if word is None:
+                return
+            start = word.start()
+        limit = start + chunk_size
+        if limit >= hi:
+            end = hi
+        else:
+            # Last whitespace at or before the limit; hard-split if the word is too long
+            end = scan.rfind(" ", start + 1, limit + 1)
+            if end == -1:
+                end = limit
+
+        chunk = text[start:end].strip()
+        if chunk:
+            yield chunk
+        if end >= hi:
+            return
+
+        # Step back by the overlap, then forward to the start of the next word
+        boundary = scan.find(" ", max(end - overlap, start), end + 1)
+        start = boundary + 1 if boundary != -1 else end
+
+
 def chunk_transcript(
     text: str,
     chunk_size: int = 500,
@@ -31,9 +129,10 @@ def chunk_transcript(
 ) -> list[str]:
     """Split transcript text into overlapping chunks.
 
-    Uses LangChain's RecursiveCharacterTextSplitter to split text into
-    chunks of approximately chunk_size characters with overlap between
-    consecutive chunks for context preservation.
+    Splits text into chunks of at most chunk_size characters, ending each
+    chunk on a word boundary and starting the next one roughly overlap
+    characters earlier (snapped forward to a word start) for context
+    preservation. Words longer than chunk_size are hard-split.
 
     Args:
         text: The transcript text to chunk.
@@ -46,28 +145,21 @@ def chunk_transcript(
     Raises:
         ValueError: If chunk_size <= 0, overlap < 0, or overlap >= chunk_size.
     """
-    if chunk_size <= 0:
-        raise ValueError("chunk_size must be positive")
-    if overlap < 0:
-        raise ValueError("overlap must be non-negative")
-    if overlap >= chunk_size:
-        raise ValueError("overlap must be less than chunk_size")
+    _validate_chunk_params(chunk_size, overlap)
 
     # Handle empty or whitespace-only text
-    if not text or not text.strip():
+    if not text or text.isspace():
         logger.debug("Empty or whitespace-only text provided to chunk_transcript")
         return []
 
     logger.debug(f"Chunking transcript with input length {len(text)} characters")
 
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=overlap,
-        length_function=len,
-        is_separator_regex=False,
-    )
+    n = len(text)
+    if n <= chunk_size:
+        return [text.strip()]
+
+    chunks = list(_split_range(text, _boundary_text(text), 0, n, chunk_size, overlap))
 
-    chunks = text_splitter.split_text(text)
     logger.info(f"Created {len(chunks)} chunks from transcript")
     return chunks
 
@@ -93,47 +185,75 @@ def chunk_dialog(
     Raises:
         ValueError: If chunk_size <= 0, overlap < 0, or overlap >= chunk_size.
     """
-    if chunk_size <= 0:
-        raise ValueError("chunk_size must be positive")
-    if overlap < 0:
-        raise ValueError("overlap must be non-negative")
-    if overlap >= chunk_size:
-        raise ValueError("overlap must be less than chunk_size")
+    _validate_chunk_params(chunk_size, overlap)
 
     if not dialog:
         return []
 
-    chunks = []
+    chunks = _build_dialog_chunks(dialog, chunk_size, overlap)
+    logger.info(f"Created {len(chunks)} chunks from dialog")
+    return chunks
+
 
-    for turn in dialog:
-        speaker = turn.get("speaker", "Unknown")
-        text = turn.get("text", "")
+def _build_dialog_chunks(dialog: list[dict], chunk_size: int, overlap: int) -> list[str]:
+    """Build speaker-prefixed chunks for each turn of a dialog.
 
-        if not text:
-            continue
+    Turn texts are joined once so word boundaries for every long turn are
+    located in a single shared scan, addressed per turn by offset. Chunks are
+    appended directly to the result list rather than resumed out of a generator.
 
-        prefix = f"[{speaker}]: "
-        full_text = prefix + text
+    Args:
+        dialog: List of dicts with 'speaker' and 'text' keys.
+        chunk_size: Maximum characters per chunk, including the prefix.
+        overlap: Overlap between chunks for long turns.
+
+    Returns:
+        Chunk strings of the form "[Speaker]: text".
+
+    Raises:
+        ValueError: If a long turn's speaker prefix leaves no room within chunk_size.
+    """
+    turns = [
+        (f"[{turn.get('speaker', 'Unknown')}]: ", turn["text"])
+        for turn in dialog
+        if turn.get("text")
+    ]
+    joined = "\n".join(turn_text for _, turn_text in turns)
+    scan = _boundary_text(joined)
+
+    chunks: list[str] = []
+    append = chunks.append
+    offset = 0
+    for prefix, turn_text in turns:
+        lo = offset
+        offset += len(turn_text) + 1
 
         # If turn fits in one chunk
-        if len(full_text) <= chunk_size:
-            chunks.append(full_text)
-        else:
-            # Split long turn using text splitter but maintain speaker prefix
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=chunk_size - len(prefix),
-                chunk_overlap=overlap,
-                length_function=len,
-                is_separator_regex=False,
-            )
-            sub_chunks = text_splitter.split_text(text)
-            for sub_chunk in sub_chunks:
-                chunks.append(prefix + sub_chunk)
+        if len(prefix) + len(turn_text) <= chunk_size:
+            append(prefix + turn_text)
+            continue
 
-    logger.info(f"Created {len(chunks)} chunks from dialog")
+        # Split long turn on word boundaries but maintain speaker prefix
+        sub_chunk_size = chunk_size - len(prefix)
+        if sub_chunk_size < max(overlap, 1):
+            raise ValueError(f"chunk_size {chunk_size} leaves no room after prefix {prefix!r}")
+        hi = lo + len(turn_text)
+        for sub_chunk in _split_range(joined, scan, lo, hi, sub_chunk_size, overlap):
+            append(prefix + sub_chunk)
     return chunks
 
 
+@lru_cache(maxsize=1024)
+def _speaker_from_label(label: str) -> str | None:
+    """Return the speaker name from a "[Speaker]:" label, or None if malformed.
+
+    Cached on the label alone, so a transcript only ever parses one label per
+    distinct speaker.
+    """
+    match = _SPEAKER_LABEL_RE.fullmatch(label)
+    return match.group(1) if match else None
+
+
 def _extract_speaker(text: str) -> str | None:
     """Extract the first speaker label from chunk text.
 
@@ -148,23 +268,31 @@ def _extract_speaker(text: str) -> str | None:
         The speaker name (e.g., "Interviewer", "Respondent") or None if not found.
     """
     # New format: [Speaker]: text...
-    new_pattern = r"^\[(\w+)\]:"
-    match = re.match(new_pattern, text)
-    if match:
-        return match.group(1)
+    if text.startswith("["):
+        label_end = text.find("]:", 1, _MAX_SPEAKER_LABEL_LEN)
+        if label_end != -1:
+            speaker = _speaker_from_label(text[: label_end + 2])
+        else:
+            match = _SPEAKER_LABEL_RE.match(text)
+            speaker = match.group(1) if match else None
+        if speaker:
+            return speaker
 
     # Legacy format: [Interviewer 0:00:00] or [Respondent 1:30:45]
-    legacy_pattern = r"\[(Interviewer|Respondent)\s+\d+:\d+:\d+\]"
-    match = re.search(legacy_pattern, text)
+    match = _LEGACY_SPEAKER_RE.search(text)
     if match:
         return match.group(1)
 
     return None
 
 
+@lru_cache(maxsize=1)
 def _get_embeddings_model() -> DatabricksEmbeddings:
     """Get configured DatabricksEmbeddings instance.
 
+    Uses lru_cache so the embeddings client is created once and reused
+    across chunk storage and search calls.
+
     Returns:
         DatabricksEmbeddings instance configured with the embedding endpoint.
     """
@@ -172,6 +300,23 @@ def _get_embeddings_model() -> DatabricksEmbeddings:
     return DatabricksEmbeddings(endpoint=settings.EMBEDDING_ENDPOINT)
 
 
+def _embed_documents(embeddings_model: DatabricksEmbeddings, texts: list[str]) -> list:
+    """Embed texts, sending sub-batches concurrently when there are many.
+
+    Small inputs go out as a single request. Larger inputs are split into
+    _EMBED_BATCH_SIZE slices whose requests run on a small thread pool so
+    endpoint round-trips overlap; results keep the input order.
+    """
+    if len(texts) <= _EMBED_BATCH_SIZE:
+        return embeddings_model.embed_documents(texts)
+
+    batches = [texts[i : i + _EMBED_BATCH_SIZE] for i in range(0, len(texts), _EMBED_BATCH_SIZE)]
+    workers = min(_EMBED_MAX_WORKERS, len(batches))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as executor:
+        results = list(executor.map(embeddings_model.embed_documents, batches))
+    return [vector for batch in results for vector in batch]
+
+
 def store_transcript_chunks(
     session: Session,
     recording_id: str,
@@ -200,32 +345,43 @@ def store_transcript_chunks(
         return 0
 
     try:
-        # Generate embeddings for all chunks in batch
+        # Generate embeddings in batch, once per distinct chunk text; repeated
+        # chunks (greetings, short acknowledgements) reuse the same vector
         embeddings_model = _get_embeddings_model()
-        embeddings = embeddings_model.embed_documents(chunks)
+        unique_index: dict[str, int] = {}
+        for chunk_text in chunks:
+            unique_index.setdefault(chunk_text, len(unique_index))
+
+        # Pack vectors into one contiguous float32 block (pgvector's storage type)
+        # instead of keeping a list of Python floats per chunk
+        embeddings = np.asarray(
+            _embed_documents(embeddings_model, list(unique_index)), dtype=np.float32
+        )
+        if len(embeddings) != len(unique_index):
+            raise ValueError(f"Expected {len(unique_index)} embeddings, got {len(embeddings)}")
 
         logger.debug(f"Generated {len(embeddings)} embeddings for recording {recording_id}")
 
-        # Create TranscriptChunk objects
-        chunk_objects = []
-        chunk_pairs = zip(chunks, embeddings, strict=True)
-        for i, (chunk_text, embedding) in enumerate(chunk_pairs):
-            speaker = _extract_speaker(chunk_text)
-            chunk_obj = TranscriptChunk(
-                recording_id=recording_id,
-                chunk_index=i,
-                content=chunk_text,
-                speaker=speaker,
-                embedding=embedding,
-            )
-            chunk_objects.append(chunk_obj)
-
-        # Bulk insert
-        session.add_all(chunk_objects)
+        rows = [
+            {
+                "recording_id": recording_id,
+                "chunk_index": i,
+                "content": chunk_text,
+                "speaker": _extract_speaker(chunk_text),
+                "embedding": embeddings[unique_index[chunk_text]],
+            }
+            for i, chunk_text in enumerate(chunks)
+        ]
+
+        if len(rows) >= _BULK_INSERT_MIN_ROWS:
+            # executemany-style INSERT, bypassing unit-of-work and identity map tracking
+            session.execute(insert(TranscriptChunk), rows)
+        else:
+            session.add_all([TranscriptChunk(**row) for row in rows])
         session.flush()
 
-        logger.info(f"Stored {len(chunk_objects)} transcript chunks for recording {recording_id}")
-        return len(chunk_objects)
+        logger.info(f"Stored {len(rows)} transcript chunks for recording {recording_id}")
+        return len(rows)
 
     except Exception as e:
         error_msg = f"Failed to store chunks for recording {recording_id}: {e}"
@@ -233,6 +389,25 @@ def store_transcript_chunks(
         raise EmbeddingError(error_msg) from e
 
 
+# Built once at import to avoid rebuilding the TextClause on every search.
+# Ordering by cosine distance (<=>) lets Postgres use the HNSW vector_cosine_ops index.
+_SIMILARITY_STMT = text("""
+    SELECT id, recording_id, chunk_index, content, speaker,
+           embedding, created_at
+    FROM transcript_chunks
+    ORDER BY embedding <=> :query_embedding
+    LIMIT :k
+""")
+_SIMILARITY_FILTERED_STMT = text("""
+    SELECT id, recording_id, chunk_index, content, speaker,
+           embedding, created_at
+    FROM transcript_chunks
+    WHERE recording_id = ANY(:recording_ids)
+    ORDER BY embedding <=> :query_embedding
+    LIMIT :k
+""")
+
+
 def similarity_search(
     session: Session,
     query: str,
@@ -270,16 +445,8 @@ def similarity_search(
         # None or empty list means search all recordings
         if recording_ids:
             # Filter by recording_ids using ANY() with array parameter
-            stmt = text("""
-                SELECT id, recording_id, chunk_index, content, speaker,
-                       embedding, created_at
-                FROM transcript_chunks
-                WHERE recording_id = ANY(:recording_ids)
-                ORDER BY embedding <=> :query_embedding
-                LIMIT :k
-            """)
             result = session.execute(
-                stmt,
+                _SIMILARITY_FILTERED_STMT,
                 {
                     "recording_ids": recording_ids,
                     "query_embedding": embedding_str,
@@ -288,14 +455,7 @@ def similarity_search(
             )
         else:
             # Search across all recordings
-            stmt = text("""
-                SELECT id, recording_id, chunk_index, content, speaker,
-                       embedding, created_at
-                FROM transcript_chunks
-                ORDER BY embedding <=> :query_embedding
-                LIMIT :k
-            """)
-            result = session.execute(stmt, {"query_embedding": embedding_str, "k": k})
+            result = session.execute(_SIMILARITY_STMT, {"query_embedding": embedding_str, "k": k})
 
         # Convert rows to TranscriptChunk objects
         chunks = []
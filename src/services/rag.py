@@ -8,14 +8,14 @@ workflow with retrieval, grading, generation, and query rewriting capabilities.
 import logging
 from typing import Any, TypedDict
 
-from databricks_langchain import ChatDatabricks, DatabricksEmbeddings
+from databricks_langchain import ChatDatabricks
 from langchain_core.messages import BaseMessage, HumanMessage
 from langgraph.graph import END, StateGraph
 from sqlalchemy.orm import Session
 
 from src.config import get_settings
 from src.models import TranscriptChunk
-from src.services.embedding import similarity_search
+from src.services.embedding import _get_embeddings_model, similarity_search
 
 logger = logging.getLogger(__name__)
 
@@ -54,16 +54,6 @@ def _get_llm() -> ChatDatabricks:
     return ChatDatabricks(endpoint=settings.LLM_ENDPOINT)
 
 
-def _get_embeddings_model() -> DatabricksEmbeddings:
-    """Get configured DatabricksEmbeddings instance.
-
-    Returns:
-        DatabricksEmbeddings instance configured with the embedding endpoint.
-    """
-    settings = get_settings()
-    return DatabricksEmbeddings(endpoint=settings.EMBEDDING_ENDPOINT)
-
-
 def _create_citation(chunk: TranscriptChunk) -> dict[str, Any]:
     """Create a citation dictionary from a TranscriptChunk.
 
@@ -7,7 +7,7 @@ token delivery, citation sending, and error handling.
 
 import json
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from typing import Any
 
 from flask import Response, request
@@ -92,6 +92,25 @@ def stream_rag_response(
     Yields:
         SSE-formatted event strings for token, citations, done, or error events.
     """
+    for event_type, data in _stream_events(query, session_id, recording_filter):
+        yield format_sse_event(event_type, data)
+
+
+def _stream_events(
+    query: str,
+    session_id: str,
+    recording_filter: list[str] | None = None,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Produce the RAG response as (event_type, data) pairs before SSE framing.
+
+    Args:
+        query: The user's question.
+        session_id: Unique session identifier.
+        recording_filter: Optional list of recording IDs to filter results.
+
+    Yields:
+        Tuples of event type (token, citations, done, error) and event data.
+    """
     logger.info(f"Starting streaming RAG response for session {session_id}")
     logger.info(f"Query: {query[:100]}...")
     if recording_filter:
@@ -112,9 +131,9 @@ def stream_rag_response(
         if not chunks:
             logger.info("No relevant documents found for query")
             no_results_msg = "No relevant information found in the available transcripts."
-            yield format_sse_event("token", {"content": no_results_msg})
-            yield format_sse_event("citations", {"citations": []})
-            yield format_sse_event("done", {})
+            yield "token", {"content": no_results_msg}
+            yield "citations", {"citations": []}
+            yield "done", {}
             return
 
         # Build context and citations
@@ -131,22 +150,22 @@ def stream_rag_response(
         # Stream tokens from LLM
         logger.info("Starting LLM token generation")
         for token in streaming_generate(query=query, context=context):
-            yield format_sse_event("token", {"content": token})
+            yield "token", {"content": token}
 
         # Send citations after all tokens
-        yield format_sse_event("citations", {"citations": citations})
+        yield "citations", {"citations": citations}
 
         # Signal completion
-        yield format_sse_event("done", {})
+        yield "done", {}
 
         logger.info(f"Completed streaming for session {session_id} with {len(citations)} citations")
 
     except Exception as e:
         logger.error(f"Error during streaming: {e}", exc_info=True)
-        yield format_sse_event("error", {
+        yield "error", {
             "message": str(e),
             "code": "GENERATION_FAILED",
-        })
+        }
     finally:
         session.close()
 
@@ -5,11 +5,67 @@ highlighting matches, and retrieving transcripts from the database.
 """
 
 import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import TypeVar
 
 from sqlalchemy.orm import Session
 
 from src.models.transcript import Transcript
 
+# Tags wrapped around each highlighted match
+_MARK_OPEN = "<mark>"
+_MARK_CLOSE = "</mark>"
+
+_KeyT = TypeVar("_KeyT")
+
+
+@lru_cache(maxsize=512)
+def _query_pattern(query: str) -> re.Pattern[str]:
+    """Compile a case-insensitive pattern matching query literally.
+
+    Cached so that repeated searches for the same term skip recompiling.
+    """
+    # Escape special regex characters in the query
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _literal_pattern(needle: str) -> re.Pattern[str]:
+    """Compile a case-sensitive pattern matching an already lowercased needle."""
+    return re.compile(re.escape(needle))
+
+
+def _first_char_absent(text: str, query: str) -> bool:
+    """Return True if query's first character occurs in text in neither case.
+
+    Only meaningful for ASCII text and query. Two single-character
+    containment checks are much cheaper than lowercasing or regex-scanning
+    the whole text, and they rule out any match for rare keywords.
+    """
+    first = query[0]
+    return first.lower() not in text and first.upper() not in text
+
+
+def _match_spans(text: str, query: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) of each non-overlapping case-insensitive match of query.
+
+    ASCII lowercasing keeps every index in place, so for ASCII text and query
+    a case-sensitive literal scan of the lowercased text finds exactly the
+    spans the IGNORECASE regex would, without its per-character case
+    folding. Anything else goes through the regex, whose Unicode case rules
+    (e.g. "k" matching the Kelvin sign) a lowercased copy cannot reproduce.
+    """
+    if text.isascii() and query.isascii():
+        if _first_char_absent(text, query):
+            return
+        for match in _literal_pattern(query.lower()).finditer(text.lower()):
+            yield match.span()
+        return
+
+    for match in _query_pattern(query).finditer(text):
+        yield match.span()
+
 
 def search_transcript(transcript_text: str, query: str) -> list[dict]:
     """Find all occurrences of query in transcript text.
@@ -28,32 +84,65 @@ def search_transcript(transcript_text: str, query: str) -> list[dict]:
             - end (int): Ending index of the match (exclusive).
             - match (str): The matched text (preserving original case).
 
-        Returns an empty list if query or text is empty, or if no matches found.
+        Returns an empty list if text is empty, if query is empty or only
+        whitespace, or if no matches found.
     """
-    if not transcript_text or not query:
+    if not transcript_text or not query or query.isspace():
         return []
 
-    # Escape special regex characters in the query
-    escaped_query = re.escape(query)
+    # Each query character matches exactly one text character, so a longer
+    # query cannot match anywhere
+    if len(query) > len(transcript_text):
+        return []
+
+    return [
+        {"start": start, "end": end, "match": transcript_text[start:end]}
+        for start, end in _match_spans(transcript_text, query)
+    ]
+
 
-    matches = []
-    for match in re.finditer(escaped_query, transcript_text, re.IGNORECASE):
-        matches.append(
-            {
-                "start": match.start(),
-                "end": match.end(),
-                "match": match.group(),
-            }
-        )
+def search_transcripts(
+    items: Iterable[tuple[_KeyT, str]],
+    query: str,
+) -> Iterator[tuple[_KeyT, list[dict]]]:
+    """Find all occurrences of one query in each of several texts.
 
-    return matches
+    Equivalent to calling search_transcript per text, but the query is
+    validated once for the whole batch, e.g. every speaker turn of a
+    transcript or every transcript in a list view.
 
+    Args:
+        items: (key, text) pairs; each key is passed through unchanged.
+        query: The search term to find.
 
+    Yields:
+        (key, matches) for every item, in order, where matches is what
+        search_transcript returns for that item's text.
+    """
+    if not query or query.isspace():
+        for key, _ in items:
+            yield key, []
+        return
+
+    for key, text in items:
+        if not text or len(query) > len(text):
+            yield key, []
+            continue
+        matches = [
+            {"start": start, "end": end, "match": text[start:end]}
+            for start, end in _match_spans(text, query)
+        ]
+        yield key, matches
+
+
+@lru_cache(maxsize=32)
 def highlight_matches(text: str, query: str) -> str:
     """Return text with query matches wrapped in <mark> tags.
 
     Performs case-insensitive matching but preserves the original case
-    of matched text in the output.
+    of matched text in the output. Results are cached per (text, query), so
+    re-rendering the same transcript search is a dictionary lookup; the
+    cache is kept small because each entry holds a whole transcript.
 
     Args:
         text: The text to add highlighting to.
@@ -61,19 +150,30 @@ def highlight_matches(text: str, query: str) -> str:
 
     Returns:
         The text with all occurrences of query wrapped in <mark></mark> tags.
-        Returns the original text unchanged if query or text is empty.
+        Returns the original text unchanged if text is empty or query is
+        empty or only whitespace.
     """
-    if not text or not query:
+    if not text or not query or query.isspace():
         return text
 
-    # Escape special regex characters in the query
-    escaped_query = re.escape(query)
+    # Each query character matches exactly one text character, so a longer
+    # query cannot match anywhere
+    if len(query) > len(text):
+        return text
+
+    # Collect segments and join once, so the output is allocated a single time
+    parts = []
+    extend = parts.extend
+    last_end = 0
+    for start, end in _match_spans(text, query):
+        extend((text[last_end:start], _MARK_OPEN, text[start:end], _MARK_CLOSE))
+        last_end = end
 
-    def replace_with_mark(match: re.Match) -> str:
-        """Wrap the matched text in mark tags."""
-        return f"<mark>{match.group()}</mark>"
+    if not parts:
+        return text
 
-    return re.sub(escaped_query, replace_with_mark, text, flags=re.IGNORECASE)
+    parts.append(text[last_end:])
+    return "".join(parts)
 
 
 def get_transcript_by_recording_id(
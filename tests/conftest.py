@@ -4,7 +4,9 @@ This module provides shared fixtures for testing database models,
 Databricks client interactions, and sample data creation.
 """
 
-from collections.abc import Generator
+import gc
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
@@ -12,11 +14,39 @@ from uuid import uuid4
 import pytest
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from src.config import Settings
 from src.models import Base, ProcessingStatus, Recording, Transcript
 
+SAMPLE_DIARIZED_TEXT = """[SPEAKER_00 0:00:00]
+Hello everyone, welcome to the meeting.
+
+[SPEAKER_01 0:00:05]
+Thanks for having us. Let's discuss the project updates.
+
+[SPEAKER_00 0:00:12]
+Sure, let me share the progress we've made this week.
+
+[SPEAKER_02 0:00:20]
+I have some questions about the timeline."""
+
+SAMPLE_FULL_TEXT = (
+    "Hello everyone, welcome to the meeting. "
+    "Thanks for having us. Let's discuss the project updates. "
+    "Sure, let me share the progress we've made this week. "
+    "I have some questions about the timeline."
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptText:
+    """Read-only text content of a transcript, without any database state."""
+
+    diarized_text: str
+    full_text: str
+
 
 @pytest.fixture(scope="session")
 def test_settings() -> Settings:
@@ -63,40 +93,86 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.close()
 
 
-@pytest.fixture(scope="function")
-def db_session() -> Generator[Session, None, None]:
-    """Create an in-memory SQLite database session for testing.
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[Engine, None, None]:
+    """Create one in-memory SQLite engine and schema for the whole test session.
 
-    Creates all tables from the Base metadata, yields a session for
-    test use, and performs cleanup (rollback, close, drop tables)
-    after each test function.
+    A StaticPool keeps every checkout on the same connection, so the
+    in-memory database (and its tables) is shared. pysqlite's own
+    transaction handling is disabled in favour of explicit BEGINs so that
+    SAVEPOINTs work, which db_session relies on for per-test isolation.
+
+    Under pytest-xdist each worker process builds its own in-memory
+    database, so DB-backed tests need no xdist_group pinning and can be
+    distributed with the default ``pytest -n auto`` scheduling.
 
     Yields:
-        Session: A SQLAlchemy session connected to an in-memory SQLite database.
+        Engine: A SQLAlchemy engine with all tables created.
     """
-    # Create in-memory SQLite engine for testing
     engine = create_engine(
         "sqlite:///:memory:",
         echo=False,
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
 
-    # Create all tables
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_engine: Engine) -> Generator[Session, None, None]:
+    """Create a database session isolated to a single test.
+
+    The session is bound to a connection inside an outer transaction, and
+    its own commits and rollbacks only release or roll back SAVEPOINTs.
+    Rolling back the outer transaction after the test discards everything
+    it wrote, without recreating the schema.
 
-    # Create session factory and session
-    TestSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    session = TestSessionLocal()
+    Yields:
+        Session: A SQLAlchemy session connected to the shared in-memory database.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     try:
         yield session
     finally:
-        # Cleanup: rollback any uncommitted changes
-        session.rollback()
         session.close()
-        # Drop all tables
-        Base.metadata.drop_all(bind=engine)
-        engine.dispose()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="class")
+def gc_disabled() -> Generator[None, None, None]:
+    """Disable cyclic garbage collection for the duration of a test class.
+
+    Intended for classes of small, purely in-memory tests that create no
+    reference cycles. A full collection runs when the class finishes.
+    """
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+        gc.collect()
 
 
 @pytest.fixture
@@ -177,43 +253,36 @@ def sample_transcript(db_session: Session, sample_recording: Recording) -> Trans
         sample_recording: The parent Recording instance.
 
     Returns:
-        Transcript: A persisted Transcript instance with realistic test data
+        Transcript: A flushed Transcript instance with realistic test data
             linked to the sample_recording.
     """
-    diarized_content = """[SPEAKER_00 0:00:00]
-Hello everyone, welcome to the meeting.
-
-[SPEAKER_01 0:00:05]
-Thanks for having us. Let's discuss the project updates.
-
-[SPEAKER_00 0:00:12]
-Sure, let me share the progress we've made this week.
-
-[SPEAKER_02 0:00:20]
-I have some questions about the timeline."""
-
-    full_text = (
-        "Hello everyone, welcome to the meeting. "
-        "Thanks for having us. Let's discuss the project updates. "
-        "Sure, let me share the progress we've made this week. "
-        "I have some questions about the timeline."
-    )
-
     transcript = Transcript(
         id=str(uuid4()),
         recording_id=sample_recording.id,
-        full_text=full_text,
+        full_text=SAMPLE_FULL_TEXT,
         language="en",
-        diarized_text=diarized_content,
+        diarized_text=SAMPLE_DIARIZED_TEXT,
         summary="Meeting discussing project updates and timeline questions.",
         created_at=datetime(2024, 1, 15, 11, 0, 0),
     )
     db_session.add(transcript)
-    db_session.commit()
-    db_session.refresh(transcript)
+    db_session.flush()
     return transcript
 
 
+@pytest.fixture(scope="session")
+def sample_transcript_text() -> TranscriptText:
+    """Return the sample transcript's text content for tests that need no database.
+
+    The content matches sample_transcript, but is built once per session and
+    is immutable, so tests cannot leak changes into each other.
+
+    Returns:
+        TranscriptText: The diarized and full text of the sample transcript.
+    """
+    return TranscriptText(diarized_text=SAMPLE_DIARIZED_TEXT, full_text=SAMPLE_FULL_TEXT)
+
+
 @pytest.fixture
 def sample_recording_pending(db_session: Session) -> Recording:
     """Create a sample Recording with PENDING status for testing processing flows.
@@ -240,6 +309,37 @@ def sample_recording_pending(db_session: Session) -> Recording:
     return recording
 
 
+@pytest.fixture
+def recording_factory(db_session: Session) -> Callable[..., Recording]:
+    """Return a factory that adds a Recording to the test session.
+
+    The recording is flushed rather than committed, so it lives only in the
+    test's transaction. Keyword arguments override the default field values.
+
+    Args:
+        db_session: The test database session.
+
+    Returns:
+        Callable[..., Recording]: A factory returning the flushed Recording.
+    """
+
+    def create(**overrides) -> Recording:
+        fields = {
+            "id": str(uuid4()),
+            "title": "Factory Recording",
+            "original_filename": "factory_recording.wav",
+            "volume_path": "/Volumes/test/default/audio-recordings/factory_recording.wav",
+            "processing_status": ProcessingStatus.COMPLETED.value,
+        }
+        fields.update(overrides)
+        recording = Recording(**fields)
+        db_session.add(recording)
+        db_session.flush()
+        return recording
+
+    return create
+
+
 @pytest.fixture
 def mock_databricks_workspace_client_patch():
     """Provide a context manager patch for WorkspaceClient.
@@ -238,7 +238,13 @@ class TestEmbeddingModelConfiguration:
         mock_embeddings_instance = MagicMock()
         mock_embeddings_class.return_value = mock_embeddings_instance
 
-        result = _get_embeddings_model()
+        _get_embeddings_model.cache_clear()
+        try:
+            result = _get_embeddings_model()
+            cached = _get_embeddings_model()
+        finally:
+            _get_embeddings_model.cache_clear()
 
         mock_embeddings_class.assert_called_once_with(endpoint=test_settings.EMBEDDING_ENDPOINT)
         assert result is mock_embeddings_instance
+        assert cached is result
@@ -143,6 +143,21 @@ class TestReconstructTranscript:
         # Should return original when nothing to reconstruct from
         assert result == sample_dialog_json
 
+    def test_reconstruct_transcript_with_empty_inputs_does_not_call_llm(
+        self,
+        sample_full_text: str,
+        sample_dialog_json: list[dict[str, Any]],
+    ) -> None:
+        """Test that empty inputs return before the LLM is created."""
+        with patch("src.services.reconstruction._get_llm") as mock_get_llm:
+            from src.services.reconstruction import reconstruct_transcript
+
+            reconstruct_transcript(sample_full_text, [])
+            reconstruct_transcript("", sample_dialog_json)
+            reconstruct_transcript("   ", sample_dialog_json)
+
+            mock_get_llm.assert_not_called()
+
 
 class TestReconstructTranscriptErrorHandling:
     """Tests for error handling in reconstruction service."""
@@ -3,14 +3,39 @@
 This module provides comprehensive tests for audio file validation,
 format conversion, and duration extraction functionality.
 
-RED phase of TDD - these tests are written before implementation
-and should fail initially.
+The module under test is imported once at module scope so librosa and
+numba are only loaded a single time per test session.
 """
 
+import io
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+import soundfile as sf
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.services.audio import (
+    ALLOWED_FORMATS,
+    MAX_FILE_SIZE,
+    TARGET_SAMPLE_RATE,
+    AudioProcessingError,
+    AudioValidationError,
+    _decode_audio,
+    _downmix_to_mono,
+    _get_cuda_resampler,
+    _get_pcm16_kernel,
+    _is_allowed_extension,
+    _resample_audio,
+    _to_pcm16,
+    convert_to_wav,
+    get_audio_duration,
+    validate_file_format,
+)
 
 
 class TestValidateFileFormat:
@@ -21,38 +46,18 @@ class TestValidateFileFormat:
     """
 
     # Valid format tests
-    @pytest.mark.parametrize(
-        "filename,file_size",
-        [
-            ("recording.mp3", 1024),
-            ("recording.wav", 1024),
-            ("recording.m4a", 1024),
-            ("recording.flac", 1024),
-        ],
-    )
-    def test_valid_formats_are_accepted(self, filename: str, file_size: int) -> None:
-        """Test that valid audio formats are accepted."""
-        from src.services.audio import validate_file_format
-
-        result = validate_file_format(filename, file_size)
-        assert result is True
-
-    @pytest.mark.parametrize(
-        "filename",
-        [
-            "RECORDING.MP3",
-            "Recording.Wav",
-            "AUDIO.M4A",
-            "music.FLAC",
-            "Mixed.Mp3",
-            "TEST.WaV",
-        ],
+    @given(
+        extension=st.sampled_from(sorted(ALLOWED_FORMATS)),
+        case=st.sampled_from(["lower", "upper", "mixed"]),
     )
-    def test_case_insensitivity_for_extensions(self, filename: str) -> None:
-        """Test that file extension validation is case-insensitive."""
-        from src.services.audio import validate_file_format
-
-        result = validate_file_format(filename, 1024)
+    def test_valid_formats_are_accepted_in_any_case(self, extension: str, case: str) -> None:
+        """Test that every allowed format is accepted, case-insensitively."""
+        if case == "upper":
+            extension = extension.upper()
+        elif case == "mixed":
+            extension = "".join(char.upper() if i % 2 else char for i, char in enumerate(extension))
+
+        result = validate_file_format(f"recording{extension}", 1024)
         assert result is True
 
     # Invalid format tests
@@ -69,8 +74,6 @@ class TestValidateFileFormat:
     )
     def test_invalid_formats_are_rejected(self, filename: str) -> None:
         """Test that non-audio formats are rejected."""
-        from src.services.audio import AudioValidationError, validate_file_format
-
         with pytest.raises(AudioValidationError) as exc_info:
             validate_file_format(filename, 1024)
 
@@ -78,8 +81,6 @@ class TestValidateFileFormat:
 
     def test_file_without_extension_is_rejected(self) -> None:
         """Test that files without extensions are rejected."""
-        from src.services.audio import AudioValidationError, validate_file_format
-
         with pytest.raises(AudioValidationError) as exc_info:
             validate_file_format("audiofile", 1024)
 
@@ -87,8 +88,6 @@ class TestValidateFileFormat:
 
     def test_empty_filename_is_rejected(self) -> None:
         """Test that empty filename is rejected."""
-        from src.services.audio import AudioValidationError, validate_file_format
-
         with pytest.raises(AudioValidationError) as exc_info:
             validate_file_format("", 1024)
 
@@ -96,30 +95,29 @@ class TestValidateFileFormat:
 
     def test_filename_with_only_extension_is_rejected(self) -> None:
         """Test that filename with only extension is rejected."""
-        from src.services.audio import AudioValidationError, validate_file_format
-
         with pytest.raises(AudioValidationError) as exc_info:
             validate_file_format(".mp3", 1024)
 
         assert "filename" in str(exc_info.value).lower() or "invalid" in str(exc_info.value).lower()
 
+    def test_extension_lookup_is_cached(self) -> None:
+        """Test that repeated extensions are served from the lookup cache."""
+        hits_before = _is_allowed_extension.cache_info().hits
+
+        validate_file_format("first.wav", 1024)
+        validate_file_format("second.wav", 1024)
+
+        assert _is_allowed_extension.cache_info().hits >= hits_before + 2
+
     # File size tests
     def test_file_exactly_at_size_limit_is_accepted(self) -> None:
         """Test that file exactly at 500MB limit is accepted."""
-        from src.services.audio import MAX_FILE_SIZE, validate_file_format
-
         # 500MB in bytes
         result = validate_file_format("recording.mp3", MAX_FILE_SIZE)
         assert result is True
 
     def test_file_over_size_limit_is_rejected(self) -> None:
         """Test that file over 500MB limit is rejected."""
-        from src.services.audio import (
-            MAX_FILE_SIZE,
-            AudioValidationError,
-            validate_file_format,
-        )
-
         # 500MB + 1 byte
         with pytest.raises(AudioValidationError) as exc_info:
             validate_file_format("recording.mp3", MAX_FILE_SIZE + 1)
@@ -128,16 +126,12 @@ class TestValidateFileFormat:
 
     def test_file_well_under_size_limit_is_accepted(self) -> None:
         """Test that small files are accepted."""
-        from src.services.audio import validate_file_format
-
         # 1MB file
         result = validate_file_format("recording.wav", 1024 * 1024)
         assert result is True
 
     def test_zero_size_file_is_rejected(self) -> None:
         """Test that zero-size files are rejected."""
-        from src.services.audio import AudioValidationError, validate_file_format
-
         with pytest.raises(AudioValidationError) as exc_info:
             validate_file_format("recording.mp3", 0)
 
@@ -145,8 +139,6 @@ class TestValidateFileFormat:
 
     def test_negative_size_is_rejected(self) -> None:
         """Test that negative file size is rejected."""
-        from src.services.audio import AudioValidationError, validate_file_format
-
         with pytest.raises(AudioValidationError) as exc_info:
             validate_file_format("recording.mp3", -1)
 
@@ -156,154 +148,235 @@ class TestValidateFileFormat:
 class TestConvertToWav:
     """Tests for the convert_to_wav() function.
 
-    The function should convert audio to 16kHz WAV format using librosa
-    and return tuple[bytes, float] where float is duration.
+    The function should convert audio to 16kHz WAV format and return
+    tuple[bytes, float] where float is duration. Conversions run against
+    real audio generated at test time rather than a mocked decoder.
     """
 
-    @pytest.fixture
-    def mock_audio_data(self) -> bytes:
-        """Create mock audio data for testing."""
-        return b"fake audio content for testing purposes"
+    @staticmethod
+    def _make_sine_wav(duration: float, sample_rate: int, channels: int = 1) -> bytes:
+        """Encode a 440Hz sine wave at half amplitude as WAV bytes."""
+        t = np.arange(int(sample_rate * duration)) / sample_rate
+        audio = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+        if channels > 1:
+            audio = np.column_stack([audio] * channels)
+        buffer = io.BytesIO()
+        sf.write(buffer, audio, sample_rate, format="WAV")
+        return buffer.getvalue()
 
     @pytest.fixture
-    def mock_librosa_load(self) -> MagicMock:
-        """Create a mock for librosa.load that returns valid audio data."""
-        # Simulated audio: 1 second of samples at 44100 Hz
-        audio_samples = np.zeros(44100, dtype=np.float32)
-        return audio_samples, 44100
-
-    def test_convert_to_wav_returns_tuple(self, mock_audio_data: bytes) -> None:
-        """Test that convert_to_wav returns a tuple of (bytes, float)."""
-        from src.services.audio import convert_to_wav
+    def tiny_wav(self) -> bytes:
+        """A 0.1s stereo 44.1kHz sine wave, exercising downmix and resample."""
+        return self._make_sine_wav(0.1, 44100, channels=2)
+
+    def test_convert_to_wav_golden(self, tiny_wav: bytes) -> None:
+        """Test a full conversion of real stereo 44.1kHz audio to 16kHz mono PCM16."""
+        result = convert_to_wav(tiny_wav)
+
+        assert isinstance(result, tuple)
+        wav_bytes, duration = result
+        assert isinstance(wav_bytes, bytes)
+        assert isinstance(duration, float)
+        assert duration == pytest.approx(0.1)
+
+        # WAV files start with a RIFF header and WAVE format identifier
+        assert wav_bytes[:4] == b"RIFF"
+        assert wav_bytes[8:12] == b"WAVE"
+
+        info = sf.info(io.BytesIO(wav_bytes))
+        assert info.samplerate == TARGET_SAMPLE_RATE
+        assert info.channels == 1
+        assert info.subtype == "PCM_16"
+        assert info.frames == int(0.1 * TARGET_SAMPLE_RATE)
+
+        # A half-amplitude sine has an RMS of 0.5 / sqrt(2)
+        decoded, _ = sf.read(io.BytesIO(wav_bytes), dtype="float32")
+        rms = float(np.sqrt(np.mean(decoded[200:-200] ** 2)))
+        assert rms == pytest.approx(0.5 / np.sqrt(2), rel=0.02)
+
+    @settings(max_examples=25, deadline=None)
+    @given(
+        duration=st.floats(min_value=0.01, max_value=1.0),
+        sample_rate=st.sampled_from([8000, 16000, 22050, 44100, 48000]),
+    )
+    def test_convert_to_wav_preserves_duration(self, duration: float, sample_rate: int) -> None:
+        """Test that the reported duration matches the input for any rate and length."""
+        source = self._make_sine_wav(duration, sample_rate)
+        expected = int(sample_rate * duration) / sample_rate
 
-        mock_audio_array = np.zeros(16000, dtype=np.float32)  # 1 second at 16kHz
+        wav_bytes, result = convert_to_wav(source)
 
-        with patch("src.services.audio.librosa") as mock_librosa:
-            mock_librosa.load.return_value = (mock_audio_array, 44100)
-            mock_librosa.resample.return_value = mock_audio_array
+        assert result == pytest.approx(expected, abs=1 / sample_rate + 1 / TARGET_SAMPLE_RATE)
+        assert sf.info(io.BytesIO(wav_bytes)).duration == pytest.approx(result)
 
-            result = convert_to_wav(mock_audio_data)
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview, io.BytesIO])
+    def test_convert_to_wav_accepts_buffers_and_file_objects(self, wrap, tiny_wav: bytes) -> None:
+        """Test that bytes-like buffers and file objects are converted directly."""
+        wav_bytes, duration = convert_to_wav(wrap(tiny_wav))
 
-            assert isinstance(result, tuple)
-            assert len(result) == 2
-            assert isinstance(result[0], bytes)
-            assert isinstance(result[1], float)
+        assert wav_bytes[:4] == b"RIFF"
+        assert duration == pytest.approx(0.1)
 
-    def test_convert_to_wav_returns_correct_duration(self, mock_audio_data: bytes) -> None:
-        """Test that convert_to_wav returns the correct duration."""
-        from src.services.audio import TARGET_SAMPLE_RATE, convert_to_wav
+    def test_convert_to_wav_handles_invalid_audio_data(self) -> None:
+        """Test that invalid audio data raises an appropriate error."""
+        invalid_data = b"this is not audio data at all"
 
-        # 2 seconds of audio at 44100 Hz source
-        source_sr = 44100
-        duration_seconds = 2.0
-        mock_audio_array = np.zeros(int(source_sr * duration_seconds), dtype=np.float32)
-        resampled_array = np.zeros(int(TARGET_SAMPLE_RATE * duration_seconds), dtype=np.float32)
+        with patch("src.services.audio._decode_audio") as mock_decode:
+            mock_decode.side_effect = Exception("Unable to load audio file")
 
-        with patch("src.services.audio.librosa") as mock_librosa:
-            mock_librosa.load.return_value = (mock_audio_array, source_sr)
-            mock_librosa.resample.return_value = resampled_array
+            with pytest.raises(AudioProcessingError) as exc_info:
+                convert_to_wav(invalid_data)
 
-            _, duration = convert_to_wav(mock_audio_data)
+            assert "audio" in str(exc_info.value).lower()
 
-            assert abs(duration - duration_seconds) < 0.01
+    def test_convert_to_wav_handles_empty_audio_data(self) -> None:
+        """Test that empty audio data raises an appropriate error."""
+        with pytest.raises(AudioProcessingError) as exc_info:
+            convert_to_wav(b"")
 
-    def test_convert_to_wav_resamples_to_16khz(self, mock_audio_data: bytes) -> None:
-        """Test that audio is resampled to 16kHz."""
-        from src.services.audio import TARGET_SAMPLE_RATE, convert_to_wav
+        assert "empty" in str(exc_info.value).lower() or "audio" in str(exc_info.value).lower()
 
-        source_sr = 44100
-        mock_audio_array = np.zeros(44100, dtype=np.float32)  # 1 second at 44100 Hz
 
-        with patch("src.services.audio.librosa") as mock_librosa:
-            mock_librosa.load.return_value = (mock_audio_array, source_sr)
-            mock_librosa.resample.return_value = np.zeros(TARGET_SAMPLE_RATE, dtype=np.float32)
+class TestDecodeAudio:
+    """Tests for the _decode_audio() helper."""
 
-            convert_to_wav(mock_audio_data)
+    def test_decode_wav_returns_samples_and_rate(self) -> None:
+        """Test that WAV data is decoded by soundfile at its native rate."""
+        buffer = io.BytesIO()
+        sf.write(buffer, np.zeros(8000, dtype=np.float32), 8000, format="WAV")
 
-            # Verify resample was called with target sample rate
-            mock_librosa.resample.assert_called_once()
-            call_kwargs = mock_librosa.resample.call_args
-            # Check that target_sr is 16000
-            assert call_kwargs.kwargs.get("target_sr") == TARGET_SAMPLE_RATE or (
-                len(call_kwargs.args) >= 3 and call_kwargs.args[2] == TARGET_SAMPLE_RATE
-            )
+        audio_array, sample_rate = _decode_audio(buffer.getvalue())
 
-    def test_convert_to_wav_returns_valid_wav_bytes(self, mock_audio_data: bytes) -> None:
-        """Test that the returned bytes represent a valid WAV file."""
-        from src.services.audio import convert_to_wav
+        assert sample_rate == 8000
+        assert audio_array.shape == (8000,)
+        assert audio_array.dtype == np.float32
 
-        mock_audio_array = np.zeros(16000, dtype=np.float32)
+    def test_decode_stereo_is_channels_first(self) -> None:
+        """Test that multi-channel audio uses the (channels, frames) layout."""
+        buffer = io.BytesIO()
+        sf.write(buffer, np.zeros((4000, 2), dtype=np.float32), 8000, format="WAV")
 
-        with patch("src.services.audio.librosa") as mock_librosa:
-            mock_librosa.load.return_value = (mock_audio_array, 44100)
-            mock_librosa.resample.return_value = mock_audio_array
+        audio_array, _ = _decode_audio(buffer.getvalue())
 
-            wav_bytes, _ = convert_to_wav(mock_audio_data)
+        assert audio_array.shape == (2, 4000)
 
-            # WAV files start with "RIFF" header
-            assert wav_bytes[:4] == b"RIFF"
-            # WAV files contain "WAVE" format identifier
-            assert b"WAVE" in wav_bytes[:12]
-
-    def test_convert_to_wav_handles_invalid_audio_data(self) -> None:
-        """Test that invalid audio data raises an appropriate error."""
-        from src.services.audio import AudioProcessingError, convert_to_wav
-
-        invalid_data = b"this is not audio data at all"
+    def test_decode_falls_back_to_librosa(self) -> None:
+        """Test that formats libsndfile cannot read are decoded by librosa."""
+        expected = (np.zeros(100, dtype=np.float32), 44100)
 
         with patch("src.services.audio.librosa") as mock_librosa:
-            mock_librosa.load.side_effect = Exception("Unable to load audio file")
+            mock_librosa.load.return_value = expected
 
-            with pytest.raises(AudioProcessingError) as exc_info:
-                convert_to_wav(invalid_data)
+            result = _decode_audio(b"not a libsndfile format")
 
-            assert "audio" in str(exc_info.value).lower()
+            mock_librosa.load.assert_called_once()
+            assert result == expected
 
-    def test_convert_to_wav_handles_empty_audio_data(self) -> None:
-        """Test that empty audio data raises an appropriate error."""
-        from src.services.audio import AudioProcessingError, convert_to_wav
 
-        with pytest.raises(AudioProcessingError) as exc_info:
-            convert_to_wav(b"")
+class TestDownmixToMono:
+    """Tests for the _downmix_to_mono() helper."""
 
-        assert "empty" in str(exc_info.value).lower() or "audio" in str(exc_info.value).lower()
+    def test_downmix_averages_channels(self) -> None:
+        """Test that channels are averaged sample by sample."""
+        stereo = np.array([[1.0, 0.5, -1.0], [0.0, 0.5, 1.0]], dtype=np.float32)
 
-    def test_convert_to_wav_preserves_audio_content(self, mock_audio_data: bytes) -> None:
-        """Test that audio content is preserved after conversion."""
-        from src.services.audio import TARGET_SAMPLE_RATE, convert_to_wav
+        mono = _downmix_to_mono(stereo)
 
-        # Create audio with non-zero values
-        source_sr = 44100
-        mock_audio_array = np.sin(np.linspace(0, 2 * np.pi, source_sr)).astype(np.float32)
-        resampled_array = np.sin(np.linspace(0, 2 * np.pi, TARGET_SAMPLE_RATE)).astype(np.float32)
+        np.testing.assert_allclose(mono, [0.5, 0.5, 0.0])
 
-        with patch("src.services.audio.librosa") as mock_librosa:
-            mock_librosa.load.return_value = (mock_audio_array, source_sr)
-            mock_librosa.resample.return_value = resampled_array
+    def test_downmix_reuses_input_buffer(self) -> None:
+        """Test that the mix is written into the input rather than a new buffer."""
+        stereo = np.ones((2, 1000), dtype=np.float32)
 
-            wav_bytes, _ = convert_to_wav(mock_audio_data)
+        mono = _downmix_to_mono(stereo)
 
-            # Verify we got non-empty WAV data
-            assert len(wav_bytes) > 44  # WAV header is 44 bytes minimum
+        assert np.shares_memory(mono, stereo)
 
-    def test_convert_to_wav_handles_stereo_audio(self, mock_audio_data: bytes) -> None:
-        """Test that stereo audio is handled correctly."""
-        from src.services.audio import convert_to_wav
 
-        # Stereo audio: 2 channels, 1 second at 44100 Hz
-        source_sr = 44100
-        stereo_audio = np.zeros((2, source_sr), dtype=np.float32)
-        mono_resampled = np.zeros(16000, dtype=np.float32)
+class TestToPcm16:
+    """Tests for the _to_pcm16() helper."""
 
-        with patch("src.services.audio.librosa") as mock_librosa:
-            mock_librosa.load.return_value = (stereo_audio, source_sr)
-            mock_librosa.to_mono.return_value = np.zeros(source_sr, dtype=np.float32)
-            mock_librosa.resample.return_value = mono_resampled
-
-            result = convert_to_wav(mock_audio_data)
-
-            # Should succeed without error
-            assert isinstance(result, tuple)
+    @pytest.fixture
+    def samples(self) -> np.ndarray:
+        """Random samples plus clip bounds and values that scale to near .5 steps."""
+        random = np.random.default_rng(0).uniform(-1.5, 1.5, 10_000)
+        edges = np.array([-1.0, 1.0, 0.0, -0.0, 1.0 / 32767, -1.0 / 32767])
+        half_steps = (np.arange(-200, 200) + 0.5) / 32767.0
+        return np.concatenate([random, edges, half_steps, np.nextafter(half_steps, 0)])
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_numba_kernel_matches_numpy_path(self, samples: np.ndarray, dtype) -> None:
+        """Test that the fused kernel and numpy fallback produce identical samples."""
+        samples = samples.astype(dtype)
+        with patch("src.services.audio._get_pcm16_kernel", return_value=None):
+            expected = _to_pcm16(samples)
+
+        result = _to_pcm16(samples)
+
+        assert result.dtype == np.int16
+        np.testing.assert_array_equal(result, expected)
+        assert result.max() == 32767
+        assert result.min() == -32768
+
+    def test_kernel_maps_nan_to_silence(self) -> None:
+        """Test that NaN samples are written as zero rather than undefined values."""
+        kernel = _get_pcm16_kernel()
+        samples = np.array([np.nan, 0.5, -np.nan], dtype=np.float32)
+        out = np.empty(samples.shape[0], dtype=np.int16)
+
+        kernel(samples, out)
+
+        assert out[0] == 0
+        assert out[2] == 0
+        assert out[1] == 16383
+
+    def test_kernel_is_none_without_numba(self) -> None:
+        """Test that a missing numba install falls back to numpy."""
+        _get_pcm16_kernel.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"numba": None, "src.services.audio_kernels": None}):
+                assert _get_pcm16_kernel() is None
+        finally:
+            _get_pcm16_kernel.cache_clear()
+
+
+class TestResampleAudio:
+    """Tests for the _resample_audio() helper."""
+
+    def test_resample_uses_soxr_without_cuda(self) -> None:
+        """Test that resampling runs on the CPU when no CUDA backend is available."""
+        with patch("src.services.audio._get_cuda_resampler", return_value=None):
+            result = _resample_audio(np.zeros(44100, dtype=np.int16), 44100)
+
+        assert result.shape == (TARGET_SAMPLE_RATE,)
+        assert result.dtype == np.int16
+
+    def test_resample_uses_cuda_backend_when_available(self) -> None:
+        """Test that resampling is offloaded to the CUDA backend when present."""
+        mock_torch = MagicMock()
+        mock_resample = MagicMock()
+        expected = np.zeros(TARGET_SAMPLE_RATE, dtype=np.int16)
+        clamped = mock_resample.return_value.round_.return_value.clamp_.return_value
+        clamped.to.return_value.cpu.return_value.numpy.return_value = expected
+
+        with patch(
+            "src.services.audio._get_cuda_resampler",
+            return_value=(mock_torch, mock_resample),
+        ):
+            result = _resample_audio(np.zeros(44100, dtype=np.int16), 44100)
+
+        mock_resample.assert_called_once()
+        assert mock_resample.call_args.args[1:] == (44100, TARGET_SAMPLE_RATE)
+        assert result is expected
+
+    def test_cuda_resampler_is_none_without_torch(self) -> None:
+        """Test that a missing torch install disables the CUDA backend."""
+        _get_cuda_resampler.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"torch": None}):
+                assert _get_cuda_resampler() is None
+        finally:
+            _get_cuda_resampler.cache_clear()
 
 
 class TestGetAudioDuration:
@@ -314,8 +387,6 @@ class TestGetAudioDuration:
 
     def test_get_duration_returns_float(self) -> None:
         """Test that get_audio_duration returns a float."""
-        from src.services.audio import get_audio_duration
-
         mock_audio_data = b"fake audio content"
 
         with patch("src.services.audio.librosa") as mock_librosa:
@@ -327,8 +398,6 @@ class TestGetAudioDuration:
 
     def test_get_duration_returns_correct_value(self) -> None:
         """Test that get_audio_duration returns the correct duration."""
-        from src.services.audio import get_audio_duration
-
         mock_audio_data = b"fake audio content"
         expected_duration = 180.75  # 3 minutes 0.75 seconds
 
@@ -351,8 +420,6 @@ class TestGetAudioDuration:
     )
     def test_get_duration_handles_various_lengths(self, duration_seconds: float) -> None:
         """Test that get_audio_duration handles various audio lengths."""
-        from src.services.audio import get_audio_duration
-
         mock_audio_data = b"fake audio content"
 
         with patch("src.services.audio.librosa") as mock_librosa:
@@ -362,10 +429,35 @@ class TestGetAudioDuration:
 
             assert result == duration_seconds
 
+    @pytest.mark.parametrize("audio_format", ["WAV", "FLAC"])
+    def test_get_duration_reads_header_without_decoding(self, audio_format: str) -> None:
+        """Test that WAV and FLAC durations come from the header, not librosa."""
+        buffer = io.BytesIO()
+        sf.write(buffer, np.zeros((24000, 2), dtype=np.float32), 8000, format=audio_format)
+
+        with patch("src.services.audio.librosa") as mock_librosa:
+            result = get_audio_duration(buffer.getvalue())
+
+            mock_librosa.get_duration.assert_not_called()
+            assert result == pytest.approx(3.0)
+
+    @pytest.mark.parametrize("unset_size", [0, 0xFFFFFFFF], ids=["zero", "max"])
+    def test_get_duration_uses_payload_when_data_size_is_unset(self, unset_size: int) -> None:
+        """Test that a streamed WAV with an unset data chunk size uses the payload length."""
+        buffer = io.BytesIO()
+        sf.write(buffer, np.zeros(16000, dtype=np.float32), 8000, format="WAV", subtype="PCM_16")
+        wav_bytes = bytearray(buffer.getvalue())
+        data_offset = wav_bytes.find(b"data")
+        wav_bytes[data_offset + 4 : data_offset + 8] = unset_size.to_bytes(4, "little")
+
+        with patch("src.services.audio.librosa") as mock_librosa:
+            result = get_audio_duration(bytes(wav_bytes))
+
+            mock_librosa.get_duration.assert_not_called()
+            assert result == pytest.approx(2.0)
+
     def test_get_duration_handles_invalid_audio(self) -> None:
         """Test that get_audio_duration raises error for invalid audio."""
-        from src.services.audio import AudioProcessingError, get_audio_duration
-
         invalid_data = b"not valid audio"
 
         with patch("src.services.audio.librosa") as mock_librosa:
@@ -380,35 +472,53 @@ class TestGetAudioDuration:
 
     def test_get_duration_handles_empty_data(self) -> None:
         """Test that get_audio_duration raises error for empty data."""
-        from src.services.audio import AudioProcessingError, get_audio_duration
-
         with pytest.raises(AudioProcessingError) as exc_info:
             get_audio_duration(b"")
 
         assert "empty" in str(exc_info.value).lower() or "audio" in str(exc_info.value).lower()
 
 
+class TestLazyLibrosaImport:
+    """Tests for deferring the librosa import until it is needed."""
+
+    def test_importing_audio_service_does_not_import_librosa(self) -> None:
+        """Test that importing the module leaves librosa unloaded."""
+        code = "import sys, src.services.audio; print('librosa' in sys.modules)"
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[2],
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_librosa_attribute_is_resolved_on_access(self) -> None:
+        """Test that accessing the module attribute imports librosa."""
+        import librosa
+
+        import src.services.audio as audio_module
+
+        assert audio_module.librosa is librosa
+
+
 class TestAudioServiceConstants:
     """Tests for audio service constants and configuration."""
 
     def test_allowed_formats_contains_expected_extensions(self) -> None:
         """Test that ALLOWED_FORMATS contains all expected extensions."""
-        from src.services.audio import ALLOWED_FORMATS
-
         expected_formats = {".mp3", ".wav", ".m4a", ".flac"}
         assert expected_formats == ALLOWED_FORMATS
 
     def test_max_file_size_is_500mb(self) -> None:
         """Test that MAX_FILE_SIZE is 500MB."""
-        from src.services.audio import MAX_FILE_SIZE
-
         expected_size = 500 * 1024 * 1024  # 500MB in bytes
         assert expected_size == MAX_FILE_SIZE
 
     def test_target_sample_rate_is_16khz(self) -> None:
         """Test that TARGET_SAMPLE_RATE is 16kHz."""
-        from src.services.audio import TARGET_SAMPLE_RATE
-
         assert TARGET_SAMPLE_RATE == 16000
 
 
@@ -417,14 +527,10 @@ class TestAudioValidationError:
 
     def test_audio_validation_error_is_exception(self) -> None:
         """Test that AudioValidationError is an Exception subclass."""
-        from src.services.audio import AudioValidationError
-
         assert issubclass(AudioValidationError, Exception)
 
     def test_audio_validation_error_stores_message(self) -> None:
         """Test that AudioValidationError stores the error message."""
-        from src.services.audio import AudioValidationError
-
         error_message = "Invalid file format: .txt"
         error = AudioValidationError(error_message)
 
@@ -436,14 +542,10 @@ class TestAudioProcessingError:
 
     def test_audio_processing_error_is_exception(self) -> None:
         """Test that AudioProcessingError is an Exception subclass."""
-        from src.services.audio import AudioProcessingError
-
         assert issubclass(AudioProcessingError, Exception)
 
     def test_audio_processing_error_stores_message(self) -> None:
         """Test that AudioProcessingError stores the error message."""
-        from src.services.audio import AudioProcessingError
-
         error_message = "Failed to process audio file"
         error = AudioProcessingError(error_message)
 
@@ -6,198 +6,115 @@ and similarity search with multiple recording IDs.
 
 NOTE: This is a TDD test file. The tests are written BEFORE the implementation
 exists. Tests will fail until the implementation is created.
+
+Tests share no mutable state and can run in parallel with pytest-xdist:
+    pytest -n auto tests/unit/test_chat_recording_filter.py
 """
 
+import json
+import re
+from collections.abc import Iterator
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
 import pytest
 
+from src.components.chat import handle_chat_submit, populate_recording_filter_options
+from src.services.embedding import similarity_search
+from src.services.rag import _retrieve_node, build_rag_graph, rag_query
+
+# Module-level state is immutable (tuples, compiled patterns) so tests stay independent
+# and can be distributed across pytest-xdist workers.
+
+# Attribute specs for collaborators that the code under test only touches in one place.
+_GRAPH_SPEC = ("invoke",)
+_STATE_GRAPH_SPEC = (
+    "add_node",
+    "add_edge",
+    "add_conditional_edges",
+    "set_entry_point",
+    "compile",
+)
+_EMBEDDINGS_SPEC = ("embed_query",)
+_SESSION_SPEC = ("execute",)
+
+# Shared, immutable query embedding; similarity_search only iterates over it.
+_DUMMY_EMBEDDING = (0.1,) * 768
+
+# Compiled once: an IN/ANY membership clause, and a WHERE clause filtering on recording_id.
+_SQL_IN_ANY = re.compile(r"\b(IN|ANY)\b", re.IGNORECASE)
+_SQL_RECORDING_FILTER = re.compile(r"\bWHERE\b.*\brecording_id\b", re.IGNORECASE | re.DOTALL)
+
+
+def _empty_rows() -> Iterator[Any]:
+    """Return a fresh, empty result-row iterator for a mocked session.execute."""
+    return iter(())
+
+
+def _mk_recording(
+    recording_id: str, title: str, duration_seconds: float, processing_status: str
+) -> SimpleNamespace:
+    """Build a read-only stand-in for a Recording row."""
+    return SimpleNamespace(
+        id=recording_id,
+        title=title,
+        duration_seconds=duration_seconds,
+        processing_status=processing_status,
+    )
+
+
+@pytest.fixture(scope="module")
+def recording_mocks() -> tuple[SimpleNamespace, ...]:
+    """Recordings covering every processing status the dropdown must handle."""
+    return (
+        _mk_recording("uuid-rec-001", "Customer Interview A", 300.0, "completed"),
+        _mk_recording("uuid-rec-002", "Product Feedback B", 600.0, "completed"),
+        _mk_recording("uuid-rec-003", "Pending Recording", 120.0, "pending"),
+        _mk_recording("uuid-rec-004", "Failed Recording", 300.0, "failed"),
+    )
+
 
 class TestRecordingFilterDropdown:
     """Test cases for recording filter dropdown functionality."""
 
-    @patch("src.components.chat.list_recordings")
-    @patch("src.components.chat.get_session")
+    @pytest.fixture
+    def chat_mocks(self):
+        """Patch list_recordings and get_session in a single patch context."""
+        with patch.multiple(
+            "src.components.chat", list_recordings=DEFAULT, get_session=DEFAULT
+        ) as mocks:
+            yield mocks
+
     def test_filter_dropdown_options_populated_from_recordings(
         self,
-        mock_get_session: MagicMock,
-        mock_list_recordings: MagicMock,
+        chat_mocks: dict[str, MagicMock],
+        recording_mocks: tuple[SimpleNamespace, ...],
     ):
         """Filter dropdown options should be populated from completed recordings."""
-        from src.components.chat import populate_recording_filter_options
-
-        # Setup mock recordings
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-
-        mock_recording_1 = MagicMock()
-        mock_recording_1.id = "uuid-rec-001"
-        mock_recording_1.title = "Customer Interview A"
-        mock_recording_1.duration_seconds = 300.0
-        mock_recording_1.processing_status = "completed"
-
-        mock_recording_2 = MagicMock()
-        mock_recording_2.id = "uuid-rec-002"
-        mock_recording_2.title = "Product Feedback B"
-        mock_recording_2.duration_seconds = 600.0
-        mock_recording_2.processing_status = "completed"
-
-        mock_recording_3 = MagicMock()
-        mock_recording_3.id = "uuid-rec-003"
-        mock_recording_3.title = "Pending Recording"
-        mock_recording_3.duration_seconds = 120.0
-        mock_recording_3.processing_status = "pending"
-
-        mock_list_recordings.return_value = [
-            mock_recording_1,
-            mock_recording_2,
-            mock_recording_3,
-        ]
+        chat_mocks["list_recordings"].return_value = list(recording_mocks)
 
         # Execute - simulating callback trigger
         options = populate_recording_filter_options("test-session-id")
 
         # Verify only completed recordings are returned
-        assert len(options) == 2
-        option_values = [opt["value"] for opt in options]
-        assert "uuid-rec-001" in option_values
-        assert "uuid-rec-002" in option_values
-        assert "uuid-rec-003" not in option_values
-
-    @patch("src.components.chat.list_recordings")
-    @patch("src.components.chat.get_session")
-    def test_filter_dropdown_excludes_failed_recordings(
-        self,
-        mock_get_session: MagicMock,
-        mock_list_recordings: MagicMock,
-    ):
-        """Filter dropdown should exclude recordings with failed status."""
-        from src.components.chat import populate_recording_filter_options
-
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-
-        mock_recording_completed = MagicMock()
-        mock_recording_completed.id = "uuid-rec-001"
-        mock_recording_completed.title = "Completed Recording"
-        mock_recording_completed.duration_seconds = 300.0
-        mock_recording_completed.processing_status = "completed"
-
-        mock_recording_failed = MagicMock()
-        mock_recording_failed.id = "uuid-rec-002"
-        mock_recording_failed.title = "Failed Recording"
-        mock_recording_failed.duration_seconds = 300.0
-        mock_recording_failed.processing_status = "failed"
-
-        mock_list_recordings.return_value = [
-            mock_recording_completed,
-            mock_recording_failed,
-        ]
-
-        options = populate_recording_filter_options("test-session-id")
-
-        assert len(options) == 1
-        assert options[0]["value"] == "uuid-rec-001"
-
-
-class TestFilteredQuerySubmission:
-    """Test cases for filtered query submission functionality."""
+        assert [opt["value"] for opt in options] == ["uuid-rec-001", "uuid-rec-002"]
 
-    @patch("src.services.rag.build_rag_graph")
-    def test_query_with_single_recording_filter(
+    @pytest.mark.parametrize("excluded_status", ["pending", "failed"])
+    def test_filter_dropdown_excludes_unfinished_recordings(
         self,
-        mock_build_graph: MagicMock,
+        chat_mocks: dict[str, MagicMock],
+        recording_mocks: tuple[SimpleNamespace, ...],
+        excluded_status: str,
     ):
-        """rag_query with single recording filter should pass it to build_rag_graph."""
-        from src.services.rag import rag_query
-
-        mock_graph = MagicMock()
-        mock_graph.invoke.return_value = {
-            "messages": [MagicMock(content="Filtered answer")],
-            "retrieved_docs": [],
-            "source_citations": [],
-        }
-        mock_build_graph.return_value = mock_graph
-
-        mock_session = MagicMock()
-
-        # Execute with single recording filter (as a list)
-        rag_query(
-            session=mock_session,
-            query="What was discussed?",
-            session_id="session-001",
-            recording_filter=["uuid-rec-001"],
-        )
-
-        # Verify recording_filter was passed to build_rag_graph
-        mock_build_graph.assert_called_once()
-        call_kwargs = mock_build_graph.call_args.kwargs
-        assert "recording_filter" in call_kwargs
-        assert call_kwargs["recording_filter"] == ["uuid-rec-001"]
+        """Filter dropdown should exclude recordings that did not complete."""
+        chat_mocks["list_recordings"].return_value = list(recording_mocks)
 
-    @patch("src.services.rag.build_rag_graph")
-    def test_query_with_multiple_recording_filters(
-        self,
-        mock_build_graph: MagicMock,
-    ):
-        """rag_query with multiple filters should pass list to build_rag_graph."""
-        from src.services.rag import rag_query
-
-        mock_graph = MagicMock()
-        mock_graph.invoke.return_value = {
-            "messages": [MagicMock(content="Multi-filtered answer")],
-            "retrieved_docs": [],
-            "source_citations": [],
-        }
-        mock_build_graph.return_value = mock_graph
-
-        mock_session = MagicMock()
-        recording_ids = ["uuid-rec-001", "uuid-rec-002", "uuid-rec-003"]
-
-        # Execute with multiple recording filters
-        rag_query(
-            session=mock_session,
-            query="Compare the interviews",
-            session_id="session-002",
-            recording_filter=recording_ids,
-        )
-
-        # Verify multiple recording IDs were passed
-        mock_build_graph.assert_called_once()
-        call_kwargs = mock_build_graph.call_args.kwargs
-        assert call_kwargs["recording_filter"] == recording_ids
-
-    @patch("src.services.rag.build_rag_graph")
-    def test_query_with_no_filter_searches_all(
-        self,
-        mock_build_graph: MagicMock,
-    ):
-        """rag_query with no recording filter should search all recordings."""
-        from src.services.rag import rag_query
-
-        mock_graph = MagicMock()
-        mock_graph.invoke.return_value = {
-            "messages": [MagicMock(content="Unfiltered answer")],
-            "retrieved_docs": [],
-            "source_citations": [],
-        }
-        mock_build_graph.return_value = mock_graph
-
-        mock_session = MagicMock()
-
-        # Execute without recording filter
-        rag_query(
-            session=mock_session,
-            query="General question",
-            session_id="session-003",
-            recording_filter=None,
-        )
+        options = populate_recording_filter_options("test-session-id")
 
-        # Verify recording_filter was None
-        mock_build_graph.assert_called_once()
-        call_kwargs = mock_build_graph.call_args.kwargs
-        assert call_kwargs.get("recording_filter") is None
+        excluded_ids = {r.id for r in recording_mocks if r.processing_status == excluded_status}
+        assert excluded_ids
+        assert excluded_ids.isdisjoint(opt["value"] for opt in options)
 
 
 class TestBuildRagGraphWithMultipleIds:
@@ -209,9 +126,7 @@ class TestBuildRagGraphWithMultipleIds:
         mock_state_graph: MagicMock,
     ):
         """build_rag_graph should accept recording_filter as list[str] | None."""
-        from src.services.rag import build_rag_graph
-
-        mock_graph_instance = MagicMock()
+        mock_graph_instance = MagicMock(spec_set=_STATE_GRAPH_SPEC)
         mock_state_graph.return_value = mock_graph_instance
 
         mock_session = MagicMock()
@@ -226,9 +141,7 @@ class TestBuildRagGraphWithMultipleIds:
         mock_state_graph: MagicMock,
     ):
         """build_rag_graph should pass recording_ids to the retrieve node closure."""
-        from src.services.rag import build_rag_graph
-
-        mock_graph_instance = MagicMock()
+        mock_graph_instance = MagicMock(spec_set=_STATE_GRAPH_SPEC)
         mock_state_graph.return_value = mock_graph_instance
 
         mock_session = MagicMock()
@@ -242,53 +155,39 @@ class TestBuildRagGraphWithMultipleIds:
         assert "retrieve" in node_names
 
 
-class TestSimilaritySearchWithMultipleIds:
-    """Test cases for similarity_search with multiple recording IDs."""
-
-    @patch("src.services.embedding._get_embeddings_model")
-    def test_similarity_search_with_single_recording_id_in_list(
-        self,
-        mock_get_embeddings: MagicMock,
-    ):
-        """similarity_search with single recording_id in list should filter."""
-        from src.services.embedding import similarity_search
-
-        mock_embeddings = MagicMock()
-        mock_embeddings.embed_query.return_value = [0.1] * 768
+@pytest.fixture(scope="class")
+def patched_embeddings() -> Iterator[MagicMock]:
+    """Patch the embeddings model once for every test in the requesting class."""
+    with patch("src.services.embedding._get_embeddings_model") as mock_get_embeddings:
+        mock_embeddings = MagicMock(spec_set=_EMBEDDINGS_SPEC)
+        mock_embeddings.embed_query.return_value = _DUMMY_EMBEDDING
         mock_get_embeddings.return_value = mock_embeddings
+        yield mock_get_embeddings
 
-        mock_session = MagicMock()
-        mock_session.execute.return_value = iter([])
 
-        # Execute with single recording ID in list form
-        similarity_search(
-            session=mock_session,
-            query="test query",
-            k=5,
-            recording_ids=["uuid-single"],
-        )
-
-        # Verify the query was executed
-        mock_session.execute.assert_called_once()
+class TestSimilaritySearchWithMultipleIds:
+    """Test cases for similarity_search with multiple recording IDs."""
 
-    @patch("src.services.embedding._get_embeddings_model")
-    def test_similarity_search_with_multiple_recording_ids(
+    @pytest.mark.parametrize(
+        "recording_ids,expect_filter",
+        [
+            (["uuid-single"], True),
+            (["uuid-001", "uuid-002", "uuid-003"], True),
+            ([], False),
+            (None, False),
+        ],
+        ids=["single_id", "multiple_ids", "empty_list", "none"],
+    )
+    def test_similarity_search_variants(
         self,
-        mock_get_embeddings: MagicMock,
+        patched_embeddings: MagicMock,
+        recording_ids: list[str] | None,
+        expect_filter: bool,
     ):
-        """similarity_search with multiple recording_ids should use IN clause."""
-        from src.services.embedding import similarity_search
-
-        mock_embeddings = MagicMock()
-        mock_embeddings.embed_query.return_value = [0.1] * 768
-        mock_get_embeddings.return_value = mock_embeddings
-
-        mock_session = MagicMock()
-        mock_session.execute.return_value = iter([])
+        """similarity_search should filter by recording_ids only when some are given."""
+        mock_session = Mock(spec=_SESSION_SPEC)
+        mock_session.execute.return_value = _empty_rows()
 
-        recording_ids = ["uuid-001", "uuid-002", "uuid-003"]
-
-        # Execute with multiple recording IDs
         similarity_search(
             session=mock_session,
             query="test query",
@@ -298,120 +197,43 @@ class TestSimilaritySearchWithMultipleIds:
 
         # Verify the query was executed
         mock_session.execute.assert_called_once()
-        call_args = mock_session.execute.call_args
-
-        # The SQL should use IN clause for multiple IDs
-        sql_text = str(call_args[0][0])
-        assert "IN" in sql_text.upper() or "ANY" in sql_text.upper()
-
-    @patch("src.services.embedding._get_embeddings_model")
-    def test_similarity_search_with_empty_list_searches_all(
-        self,
-        mock_get_embeddings: MagicMock,
-    ):
-        """similarity_search with empty recording_ids list should search all."""
-        from src.services.embedding import similarity_search
-
-        mock_embeddings = MagicMock()
-        mock_embeddings.embed_query.return_value = [0.1] * 768
-        mock_get_embeddings.return_value = mock_embeddings
-
-        mock_session = MagicMock()
-        mock_session.execute.return_value = iter([])
-
-        # Execute with empty list
-        similarity_search(
-            session=mock_session,
-            query="test query",
-            k=5,
-            recording_ids=[],
-        )
-
-        # Verify query was executed without recording filter
-        mock_session.execute.assert_called_once()
-        call_args = mock_session.execute.call_args
-        sql_text = str(call_args[0][0])
+        sql_text = str(mock_session.execute.call_args[0][0])
 
-        # SQL should NOT have recording_id filter when empty list
-        # Check that WHERE clause doesn't contain recording_id or uses no filter
-        assert "WHERE" not in sql_text.upper() or "recording_id" not in sql_text.lower()
-
-    @patch("src.services.embedding._get_embeddings_model")
-    def test_similarity_search_with_none_searches_all(
-        self,
-        mock_get_embeddings: MagicMock,
-    ):
-        """similarity_search with None recording_ids should search all."""
-        from src.services.embedding import similarity_search
-
-        mock_embeddings = MagicMock()
-        mock_embeddings.embed_query.return_value = [0.1] * 768
-        mock_get_embeddings.return_value = mock_embeddings
-
-        mock_session = MagicMock()
-        mock_session.execute.return_value = iter([])
-
-        # Execute with None
-        similarity_search(
-            session=mock_session,
-            query="test query",
-            k=5,
-            recording_ids=None,
-        )
-
-        # Verify query was executed
-        mock_session.execute.assert_called_once()
+        if expect_filter:
+            # The SQL should use an IN/ANY clause for the given IDs
+            assert _SQL_IN_ANY.search(sql_text) is not None
+        else:
+            # None or empty list searches all recordings without a recording_id filter
+            assert _SQL_RECORDING_FILTER.search(sql_text) is None
 
 
 class TestRetrieveNodeWithMultipleIds:
     """Test cases for _retrieve_node with multiple recording IDs."""
 
+    @pytest.mark.parametrize(
+        "recording_ids",
+        [["uuid-001", "uuid-002"], None],
+        ids=["recording_ids_list", "none_searches_all"],
+    )
     @patch("src.services.rag.similarity_search")
-    def test_retrieve_node_with_recording_ids_list(
-        self,
-        mock_similarity_search: MagicMock,
-    ):
-        """_retrieve_node should pass recording_ids list to similarity_search."""
-        from src.services.rag import _retrieve_node
-
-        mock_similarity_search.return_value = []
-
-        mock_session = MagicMock()
-        recording_ids = ["uuid-001", "uuid-002"]
-        state: dict[str, Any] = {
-            "messages": [MagicMock(content="Test query")],
-            "retrieved_docs": [],
-            "source_citations": [],
-        }
-
-        _retrieve_node(state, session=mock_session, recording_ids=recording_ids)
-
-        mock_similarity_search.assert_called_once()
-        call_kwargs = mock_similarity_search.call_args.kwargs
-        assert call_kwargs.get("recording_ids") == recording_ids
-
-    @patch("src.services.rag.similarity_search")
-    def test_retrieve_node_with_none_searches_all(
+    def test_retrieve_node_passes_recording_ids(
         self,
         mock_similarity_search: MagicMock,
+        recording_ids: list[str] | None,
     ):
-        """_retrieve_node with None recording_ids should search all recordings."""
-        from src.services.rag import _retrieve_node
-
+        """_retrieve_node should pass recording_ids through to similarity_search."""
         mock_similarity_search.return_value = []
 
-        mock_session = MagicMock()
         state: dict[str, Any] = {
-            "messages": [MagicMock(content="Test query")],
+            "messages": [SimpleNamespace(content="Test query")],
             "retrieved_docs": [],
             "source_citations": [],
         }
 
-        _retrieve_node(state, session=mock_session, recording_ids=None)
+        _retrieve_node(state, session=Mock(), recording_ids=recording_ids)
 
         mock_similarity_search.assert_called_once()
-        call_kwargs = mock_similarity_search.call_args.kwargs
-        assert call_kwargs.get("recording_ids") is None
+        assert mock_similarity_search.call_args.kwargs.get("recording_ids") == recording_ids
 
 
 class TestChatCallbackWithRecordingFilter:
@@ -421,10 +243,6 @@ class TestChatCallbackWithRecordingFilter:
         self,
     ):
         """Chat callback should include selected recording IDs in SSE payload."""
-        import json
-
-        from src.components.chat import handle_chat_submit
-
         selected_recordings = ["uuid-rec-001", "uuid-rec-002"]
 
         # Simulate chat submission with filter
@@ -452,10 +270,6 @@ class TestChatCallbackWithRecordingFilter:
         self,
     ):
         """Chat callback with no filter should not include recording_filter in SSE payload."""
-        import json
-
-        from src.components.chat import handle_chat_submit
-
         # Simulate chat submission without filter (None)
         result = handle_chat_submit(
             n_clicks=1,
@@ -478,6 +292,7 @@ class TestChatCallbackWithRecordingFilter:
         assert "recording_filter" not in payload
 
 
+@patch("src.services.rag.build_rag_graph")
 class TestRecordingFilterIntegration:
     """Integration tests for recording filter across components."""
 
@@ -491,7 +306,6 @@ class TestRecordingFilterIntegration:
             (["uuid-001", "uuid-002", "uuid-003"], "filter_multiple"),
         ],
     )
-    @patch("src.services.rag.build_rag_graph")
     def test_recording_filter_behavior_matrix(
         self,
         mock_build_graph: MagicMock,
@@ -499,11 +313,9 @@ class TestRecordingFilterIntegration:
         expected_behavior: str,
     ):
         """Test recording filter behavior across different input scenarios."""
-        from src.services.rag import rag_query
-
-        mock_graph = MagicMock()
+        mock_graph = MagicMock(spec_set=_GRAPH_SPEC)
         mock_graph.invoke.return_value = {
-            "messages": [MagicMock(content="Test answer")],
+            "messages": [SimpleNamespace(content="Test answer")],
             "retrieved_docs": [],
             "source_citations": [],
         }
@@ -520,11 +332,15 @@ class TestRecordingFilterIntegration:
 
         mock_build_graph.assert_called_once()
         call_kwargs = mock_build_graph.call_args.kwargs
-        actual_filter = call_kwargs.get("recording_filter")
+        assert "recording_filter" in call_kwargs
+        actual_filter = call_kwargs["recording_filter"]
 
         if expected_behavior == "search_all":
-            # Empty list or None should result in searching all
-            assert actual_filter is None or actual_filter == []
+            # None and an empty list are both passed through unchanged
+            if filter_input is None:
+                assert actual_filter is None
+            else:
+                assert actual_filter == []
         elif expected_behavior == "filter_single":
             assert actual_filter == filter_input
             assert len(actual_filter) == 1
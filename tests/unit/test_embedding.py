@@ -6,6 +6,7 @@ and storing transcript chunks with embeddings.
 
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 
@@ -121,6 +122,13 @@ In my previous role, I was responsible for managing a team of developers and ove
 
         assert result == []
 
+    def test_whitespace_only_text_still_validates_parameters(self):
+        """Invalid parameters should raise even when the text is blank."""
+        from src.services.embedding import chunk_transcript
+
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            chunk_transcript("  \n ", chunk_size=0, overlap=50)
+
     def test_default_parameters(self):
         """Function should work with default parameters (chunk_size=500, overlap=50)."""
         from src.services.embedding import chunk_transcript
@@ -330,6 +338,19 @@ class TestExtractSpeaker:
         assert _extract_speaker("[Respondent 1:30:45] Text") == "Respondent"
         assert _extract_speaker("[Interviewer 12:59:59] Text") == "Interviewer"
 
+    def test_speaker_labels_are_cached_per_speaker(self):
+        """Chunks from the same speaker should share one cached label lookup."""
+        from src.services.embedding import _extract_speaker, _speaker_from_label
+
+        _speaker_from_label.cache_clear()
+
+        assert _extract_speaker("[Interviewer]: First question.") == "Interviewer"
+        assert _extract_speaker("[Interviewer]: Second question.") == "Interviewer"
+
+        cache_info = _speaker_from_label.cache_info()
+        assert cache_info.currsize == 1
+        assert cache_info.hits == 1
+
 
 class TestChunkTranscriptEdgeCases:
     """Edge case tests for chunk_transcript() function."""
@@ -400,6 +421,39 @@ Third paragraph continuing the conversation."""
         chunks_with_newlines = [c for c in result if "\n" in c]
         assert len(chunks_with_newlines) > 0
 
+    def test_chunks_are_verbatim_slices_of_text(self):
+        """Chunks should be sliced from the input, not rebuilt from split words."""
+        from src.services.embedding import chunk_transcript
+
+        text = "alpha  beta\tgamma\n\ndelta   epsilon " * 40
+
+        result = chunk_transcript(text, chunk_size=120, overlap=15)
+
+        assert len(result) > 1
+        assert all(chunk in text for chunk in result)
+        assert any("  " in chunk for chunk in result)
+
+    def test_chunks_cover_every_word_within_size(self):
+        """Chunks should stay within chunk_size, start on words, and drop no words."""
+        from src.services.embedding import chunk_transcript
+
+        words = [f"caf\u00e9{i}" * (1 + i % 4) for i in range(300)]
+        text = "  \n".join(words)
+        result = chunk_transcript(text, chunk_size=60, overlap=15)
+
+        assert all(0 < len(chunk) <= 60 for chunk in result)
+        assert all(chunk == chunk.strip() for chunk in result)
+        chunk_words = {word for chunk in result for word in chunk.split()}
+        assert chunk_words == set(words)
+
+    def test_word_longer_than_chunk_size_is_hard_split(self):
+        """A single word longer than chunk_size should be split at chunk_size."""
+        from src.services.embedding import chunk_transcript
+
+        result = chunk_transcript("x" * 550, chunk_size=500, overlap=50)
+
+        assert result == ["x" * 500, "x" * 50]
+
     def test_overlap_larger_than_chunk_size_raises_error(self):
         """Overlap larger than chunk_size should raise ValueError."""
         from src.services.embedding import chunk_transcript
@@ -575,6 +629,133 @@ class TestStoreTranscriptChunks:
         for i, chunk in enumerate(stored_chunks):
             assert chunk.chunk_index == i
 
+    @patch("src.services.embedding._get_embeddings_model")
+    def test_duplicate_chunks_are_embedded_once(
+        self,
+        mock_get_embeddings: MagicMock,
+    ) -> None:
+        """Test that repeated chunk text is embedded once and fanned back out."""
+        from src.services.embedding import store_transcript_chunks
+
+        mock_embeddings_instance = MagicMock()
+        mock_embeddings_instance.embed_documents.return_value = [
+            [0.1] * 1024,
+            [0.2] * 1024,
+        ]
+        mock_get_embeddings.return_value = mock_embeddings_instance
+
+        mock_session = MagicMock()
+        stored_chunks = []
+        mock_session.add_all.side_effect = lambda chunks: stored_chunks.extend(chunks)
+
+        chunks = ["[Interviewer]: Okay.", "[Respondent]: Sure.", "[Interviewer]: Okay."]
+        result = store_transcript_chunks(
+            session=mock_session,
+            recording_id="test-id",
+            chunks=chunks,
+            title="Test",
+        )
+
+        assert result == 3
+        mock_embeddings_instance.embed_documents.assert_called_once_with(
+            ["[Interviewer]: Okay.", "[Respondent]: Sure."]
+        )
+        assert [chunk.chunk_index for chunk in stored_chunks] == [0, 1, 2]
+        assert [chunk.content for chunk in stored_chunks] == chunks
+        assert np.array_equal(stored_chunks[0].embedding, stored_chunks[2].embedding)
+        assert np.allclose(stored_chunks[0].embedding, 0.1)
+        assert np.allclose(stored_chunks[1].embedding, 0.2)
+
+    @patch("src.services.embedding._get_embeddings_model")
+    def test_embeddings_are_stored_as_float32(
+        self,
+        mock_get_embeddings: MagicMock,
+    ) -> None:
+        """Test that embeddings are packed into float32 vectors before storage."""
+        from src.services.embedding import store_transcript_chunks
+
+        mock_embeddings_instance = MagicMock()
+        mock_embeddings_instance.embed_documents.return_value = [[0.25] * 1024, [0.5] * 1024]
+        mock_get_embeddings.return_value = mock_embeddings_instance
+
+        mock_session = MagicMock()
+        stored_chunks = []
+        mock_session.add_all.side_effect = lambda chunks: stored_chunks.extend(chunks)
+
+        store_transcript_chunks(
+            session=mock_session,
+            recording_id="test-id",
+            chunks=["chunk 0", "chunk 1"],
+            title="Test",
+        )
+
+        for chunk, expected in zip(stored_chunks, (0.25, 0.5), strict=True):
+            assert chunk.embedding.dtype == np.float32
+            assert chunk.embedding.shape == (1024,)
+            assert np.all(chunk.embedding == expected)
+
+    @patch("src.services.embedding._get_embeddings_model")
+    def test_large_chunk_sets_use_bulk_insert(
+        self,
+        mock_get_embeddings: MagicMock,
+    ) -> None:
+        """Test that long transcripts are stored with one bulk INSERT."""
+        from src.services.embedding import _BULK_INSERT_MIN_ROWS, store_transcript_chunks
+
+        chunks = [f"[Respondent]: chunk {i}" for i in range(_BULK_INSERT_MIN_ROWS)]
+        mock_embeddings_instance = MagicMock()
+        mock_embeddings_instance.embed_documents.side_effect = lambda texts: [
+            [0.1] * 1024 for _ in texts
+        ]
+        mock_get_embeddings.return_value = mock_embeddings_instance
+
+        mock_session = MagicMock()
+
+        result = store_transcript_chunks(
+            session=mock_session,
+            recording_id="test-id",
+            chunks=chunks,
+            title="Test",
+        )
+
+        assert result == len(chunks)
+        mock_session.add_all.assert_not_called()
+        mock_session.execute.assert_called_once()
+        rows = mock_session.execute.call_args[0][1]
+        assert [row["chunk_index"] for row in rows] == list(range(len(chunks)))
+        assert all(row["speaker"] == "Respondent" for row in rows)
+        mock_session.flush.assert_called_once()
+
+    @patch("src.services.embedding._get_embeddings_model")
+    def test_many_chunks_are_embedded_in_ordered_sub_batches(
+        self,
+        mock_get_embeddings: MagicMock,
+    ) -> None:
+        """Test that large chunk sets are embedded in sub-batches, keeping input order."""
+        from src.services.embedding import _EMBED_BATCH_SIZE, store_transcript_chunks
+
+        chunks = [f"chunk {i}" for i in range(_EMBED_BATCH_SIZE * 2 + 5)]
+        mock_embeddings_instance = MagicMock()
+        mock_embeddings_instance.embed_documents.side_effect = lambda texts: [
+            [float(text.split()[1])] * 1024 for text in texts
+        ]
+        mock_get_embeddings.return_value = mock_embeddings_instance
+
+        mock_session = MagicMock()
+        stored_chunks = []
+        mock_session.add_all.side_effect = stored_chunks.extend
+
+        store_transcript_chunks(
+            session=mock_session,
+            recording_id="test-id",
+            chunks=chunks,
+            title="Test",
+        )
+
+        batches = [c.args[0] for c in mock_embeddings_instance.embed_documents.call_args_list]
+        assert sorted(len(batch) for batch in batches) == [5, _EMBED_BATCH_SIZE, _EMBED_BATCH_SIZE]
+        assert [chunk.embedding[0] for chunk in stored_chunks] == list(range(len(chunks)))
+
 
 class TestSimilaritySearch:
     """Test cases for similarity_search() function."""
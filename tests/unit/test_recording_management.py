@@ -7,15 +7,61 @@ RED phase of TDD - these tests are written before implementation
 and should fail initially.
 """
 
+import re
+from collections.abc import Callable
 from unittest.mock import MagicMock, patch
-from uuid import uuid4
 
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
 from sqlalchemy.orm import Session
 
 from src.models import ProcessingStatus, Recording, Transcript
-
-
+from src.services import recording as recording_svc
+from src.services.recording import delete_recording, update_recording, validate_title
+
+# A well-formed UUID that no test fixture ever creates
+_NONEXISTENT_ID = "00000000-0000-4000-8000-000000000000"
+
+# (raw title, expected normalized title)
+VALID_TITLE_CASES = [
+    ("Test Recording Title", "Test Recording Title"),
+    (
+        "Meeting 2024-01-15 (Sales Team) - Q4 Review!",
+        "Meeting 2024-01-15 (Sales Team) - Q4 Review!",
+    ),
+    ("Cafe Meeting Notes", "Cafe Meeting Notes"),
+    ("A", "A"),
+    ("Test   Recording   Title", "Test   Recording   Title"),
+    ("Test\tRecording\tTitle", "Test\tRecording\tTitle"),
+]
+
+# Outer whitespace, and a title core that starts and ends on a non-whitespace
+# character and fits within the 255-character limit
+_OUTER_WHITESPACE = st.text(alphabet=" \t\n\r", max_size=8)
+_TITLE_CORE = st.text(min_size=1, max_size=200).filter(lambda title: title.strip() == title)
+
+# Expected ValueError messages, compiled once and passed to pytest.raises(match=...)
+EMPTY_RE = re.compile(r"empty|title", re.IGNORECASE)
+LENGTH_RE = re.compile(r"255|length", re.IGNORECASE)
+NOT_FOUND_RE = re.compile(r"not found", re.IGNORECASE)
+
+# Titles that are empty once stripped
+EMPTY_TITLE_CASES = ["", " ", "   ", "\t", "\n", "\r\n", "   \t   ", "\n\t\r", "     \n     "]
+
+# (title length, whether validate_title accepts it) around the 255-character limit
+LENGTH_BOUNDARY_CASES = [
+    (254, True),
+    (255, True),
+    (256, False),
+    (300, False),
+    (500, False),
+    (1000, False),
+]
+_TITLES_BY_LENGTH = {length: "A" * length for length, _ in LENGTH_BOUNDARY_CASES}
+
+
+@pytest.mark.usefixtures("gc_disabled")
 class TestValidateTitle:
     """Tests for the validate_title() function.
 
@@ -24,167 +70,32 @@ class TestValidateTitle:
     should be stripped of leading/trailing whitespace and returned.
     """
 
-    def test_valid_title_returns_stripped_title(self) -> None:
-        """Test that a valid title is returned after stripping whitespace."""
-        from src.services.recording import validate_title
-
-        result = validate_title("Test Recording Title")
-
-        assert result == "Test Recording Title"
-
-    def test_valid_title_with_leading_whitespace_is_stripped(self) -> None:
-        """Test that leading whitespace is stripped from valid title."""
-        from src.services.recording import validate_title
-
-        result = validate_title("   Test Recording Title")
-
-        assert result == "Test Recording Title"
-
-    def test_valid_title_with_trailing_whitespace_is_stripped(self) -> None:
-        """Test that trailing whitespace is stripped from valid title."""
-        from src.services.recording import validate_title
-
-        result = validate_title("Test Recording Title   ")
-
-        assert result == "Test Recording Title"
-
-    def test_valid_title_with_both_whitespace_is_stripped(self) -> None:
-        """Test that both leading and trailing whitespace is stripped."""
-        from src.services.recording import validate_title
-
-        result = validate_title("   Test Recording Title   ")
-
-        assert result == "Test Recording Title"
-
-    def test_empty_string_raises_value_error(self) -> None:
-        """Test that empty string raises ValueError."""
-        from src.services.recording import validate_title
-
-        with pytest.raises(ValueError) as exc_info:
-            validate_title("")
-
-        assert "empty" in str(exc_info.value).lower() or "title" in str(exc_info.value).lower()
-
-    def test_whitespace_only_raises_value_error(self) -> None:
-        """Test that whitespace-only string raises ValueError."""
-        from src.services.recording import validate_title
-
-        with pytest.raises(ValueError) as exc_info:
-            validate_title("   ")
-
-        assert "empty" in str(exc_info.value).lower() or "title" in str(exc_info.value).lower()
-
-    @pytest.mark.parametrize(
-        "whitespace_title",
-        [
-            " ",
-            "  ",
-            "\t",
-            "\n",
-            "\r\n",
-            "   \t   ",
-            "\n\t\r",
-            "     \n     ",
-        ],
-    )
-    def test_various_whitespace_only_strings_raise_value_error(self, whitespace_title: str) -> None:
-        """Test that various whitespace-only strings raise ValueError."""
-        from src.services.recording import validate_title
-
-        with pytest.raises(ValueError) as exc_info:
-            validate_title(whitespace_title)
-
-        assert "empty" in str(exc_info.value).lower() or "title" in str(exc_info.value).lower()
-
-    def test_title_exceeds_255_chars_raises_value_error(self) -> None:
-        """Test that title exceeding 255 characters raises ValueError."""
-        from src.services.recording import validate_title
-
-        long_title = "A" * 256
-
-        with pytest.raises(ValueError) as exc_info:
-            validate_title(long_title)
-
-        assert "255" in str(exc_info.value) or "length" in str(exc_info.value).lower()
-
-    def test_title_exactly_255_chars_succeeds(self) -> None:
-        """Test that title with exactly 255 characters is accepted."""
-        from src.services.recording import validate_title
-
-        exactly_255_title = "A" * 255
-        result = validate_title(exactly_255_title)
-
-        assert result == exactly_255_title
-        assert len(result) == 255
-
-    def test_title_at_254_chars_succeeds(self) -> None:
-        """Test that title with 254 characters is accepted."""
-        from src.services.recording import validate_title
-
-        title_254 = "B" * 254
-        result = validate_title(title_254)
-
-        assert result == title_254
-        assert len(result) == 254
-
-    @pytest.mark.parametrize(
-        "length",
-        [256, 300, 500, 1000],
-    )
-    def test_titles_over_255_chars_raise_value_error(self, length: int) -> None:
-        """Test that titles over 255 characters raise ValueError."""
-        from src.services.recording import validate_title
-
-        long_title = "X" * length
-
-        with pytest.raises(ValueError) as exc_info:
-            validate_title(long_title)
-
-        assert "255" in str(exc_info.value) or "length" in str(exc_info.value).lower()
+    @pytest.mark.parametrize(("raw", "expected"), VALID_TITLE_CASES)
+    def test_valid_title_is_returned_stripped(self, raw: str, expected: str) -> None:
+        """Test that valid titles are accepted with only outer whitespace stripped."""
+        assert validate_title(raw) == expected
 
-    def test_title_with_special_characters_succeeds(self) -> None:
-        """Test that title with special characters is accepted."""
-        from src.services.recording import validate_title
+    @pytest.mark.parametrize(("length", "accepted"), LENGTH_BOUNDARY_CASES)
+    def test_length_boundary(self, length: int, accepted: bool) -> None:
+        """Test that titles up to 255 characters pass and longer ones raise ValueError."""
+        title = _TITLES_BY_LENGTH[length]
 
-        special_title = "Meeting 2024-01-15 (Sales Team) - Q4 Review!"
-        result = validate_title(special_title)
+        if accepted:
+            assert validate_title(title) == title
+        else:
+            with pytest.raises(ValueError, match=LENGTH_RE):
+                validate_title(title)
 
-        assert result == special_title
+    @given(lead=_OUTER_WHITESPACE, core=_TITLE_CORE, trail=_OUTER_WHITESPACE)
+    def test_outer_whitespace_is_stripped(self, lead: str, core: str, trail: str) -> None:
+        """Test that leading/trailing whitespace is stripped and the rest is preserved."""
+        assert validate_title(lead + core + trail) == core
 
-    def test_title_with_unicode_characters_succeeds(self) -> None:
-        """Test that title with unicode characters is accepted."""
-        from src.services.recording import validate_title
-
-        unicode_title = "Cafe Meeting Notes"
-        result = validate_title(unicode_title)
-
-        assert result == unicode_title
-
-    def test_single_character_title_succeeds(self) -> None:
-        """Test that single character title is accepted."""
-        from src.services.recording import validate_title
-
-        result = validate_title("A")
-
-        assert result == "A"
-
-    def test_title_with_internal_whitespace_is_preserved(self) -> None:
-        """Test that internal whitespace is preserved in title."""
-        from src.services.recording import validate_title
-
-        title_with_spaces = "Test   Recording   Title"
-        result = validate_title(title_with_spaces)
-
-        assert result == "Test   Recording   Title"
-
-    def test_title_with_tabs_inside_is_preserved(self) -> None:
-        """Test that internal tabs are preserved in title."""
-        from src.services.recording import validate_title
-
-        title_with_tabs = "Test\tRecording\tTitle"
-        result = validate_title(title_with_tabs)
-
-        assert result == "Test\tRecording\tTitle"
+    @pytest.mark.parametrize("raw", EMPTY_TITLE_CASES)
+    def test_empty_title_raises_value_error(self, raw: str) -> None:
+        """Test that empty and whitespace-only titles raise ValueError."""
+        with pytest.raises(ValueError, match=EMPTY_RE):
+            validate_title(raw)
 
 
 class TestUpdateRecording:
@@ -199,8 +110,6 @@ class TestUpdateRecording:
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that recording title is successfully updated."""
-        from src.services.recording import update_recording
-
         new_title = "Updated Recording Title"
         result = update_recording(
             session=db_session,
@@ -213,28 +122,20 @@ class TestUpdateRecording:
 
     def test_recording_not_found_raises_value_error(self, db_session: Session) -> None:
         """Test that ValueError is raised when recording is not found."""
-        from src.services.recording import update_recording
-
-        nonexistent_id = str(uuid4())
-
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
             update_recording(
                 session=db_session,
-                recording_id=nonexistent_id,
+                recording_id=_NONEXISTENT_ID,
                 title="New Title",
             )
 
-        assert "not found" in str(exc_info.value).lower()
-
     def test_validates_title_before_updating(
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that title is validated before update is performed."""
-        from src.services.recording import update_recording
-
         original_title = sample_recording.title
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=EMPTY_RE):
             update_recording(
                 session=db_session,
                 recording_id=sample_recording.id,
@@ -242,20 +143,17 @@ class TestUpdateRecording:
             )
 
         # Verify the original title was not changed
-        db_session.refresh(sample_recording)
+        db_session.expire(sample_recording, ["title"])
         assert sample_recording.title == original_title
-        assert "empty" in str(exc_info.value).lower() or "title" in str(exc_info.value).lower()
 
     def test_validates_title_length_before_updating(
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that title length is validated before update."""
-        from src.services.recording import update_recording
-
         original_title = sample_recording.title
         too_long_title = "A" * 256
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=LENGTH_RE):
             update_recording(
                 session=db_session,
                 recording_id=sample_recording.id,
@@ -263,16 +161,13 @@ class TestUpdateRecording:
             )
 
         # Verify the original title was not changed
-        db_session.refresh(sample_recording)
+        db_session.expire(sample_recording, ["title"])
         assert sample_recording.title == original_title
-        assert "255" in str(exc_info.value) or "length" in str(exc_info.value).lower()
 
     def test_updates_timestamp_on_successful_update(
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that updated_at timestamp is set on successful update."""
-        from src.services.recording import update_recording
-
         # Store original updated_at value (may be None initially)
         original_updated_at = sample_recording.updated_at
 
@@ -291,8 +186,6 @@ class TestUpdateRecording:
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that None title parameter doesn't change the title."""
-        from src.services.recording import update_recording
-
         original_title = sample_recording.title
 
         result = update_recording(
@@ -307,11 +200,9 @@ class TestUpdateRecording:
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that whitespace-only title raises ValueError."""
-        from src.services.recording import update_recording
-
         original_title = sample_recording.title
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=EMPTY_RE):
             update_recording(
                 session=db_session,
                 recording_id=sample_recording.id,
@@ -319,16 +210,13 @@ class TestUpdateRecording:
             )
 
         # Verify the original title was not changed
-        db_session.refresh(sample_recording)
+        db_session.expire(sample_recording, ["title"])
         assert sample_recording.title == original_title
-        assert "empty" in str(exc_info.value).lower() or "title" in str(exc_info.value).lower()
 
     def test_title_is_stripped_before_saving(
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that title whitespace is stripped before saving."""
-        from src.services.recording import update_recording
-
         result = update_recording(
             session=db_session,
             recording_id=sample_recording.id,
@@ -341,8 +229,6 @@ class TestUpdateRecording:
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that the function returns the updated Recording instance."""
-        from src.services.recording import update_recording
-
         result = update_recording(
             session=db_session,
             recording_id=sample_recording.id,
@@ -357,8 +243,6 @@ class TestUpdateRecording:
         self, db_session: Session, sample_recording: Recording
     ) -> None:
         """Test that other recording fields are preserved during title update."""
-        from src.services.recording import update_recording
-
         original_volume_path = sample_recording.volume_path
         original_original_filename = sample_recording.original_filename
         original_processing_status = sample_recording.processing_status
@@ -369,33 +253,38 @@ class TestUpdateRecording:
             title="New Title",
         )
 
+        # Reload just the checked columns from the database
+        db_session.expire(result, ["volume_path", "original_filename", "processing_status"])
         assert result.volume_path == original_volume_path
         assert result.original_filename == original_original_filename
         assert result.processing_status == original_processing_status
 
 
-class TestDeleteRecordingCascade:
+@patch.object(recording_svc, "delete_recording_chunks")
+class TestDeleteRecording:
     """Tests for the delete_recording() function.
 
     The function should delete a recording and all associated data
     in the correct cascade order: chunks -> transcript -> volume file -> recording.
+    delete_recording_chunks is patched for every test in the class.
     """
 
-    def test_not_found_raises_value_error(self, db_session: Session) -> None:
+    @pytest.mark.parametrize("recording_id", [_NONEXISTENT_ID, ""], ids=["unknown", "empty"])
+    def test_not_found_raises_value_error(
+        self,
+        mock_delete_chunks: MagicMock,
+        db_session: Session,
+        recording_id: str,
+    ) -> None:
         """Test that ValueError is raised when recording is not found."""
-        from src.services.recording import delete_recording
-
-        nonexistent_id = str(uuid4())
-
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
             delete_recording(
                 session=db_session,
-                recording_id=nonexistent_id,
+                recording_id=recording_id,
             )
 
-        assert "not found" in str(exc_info.value).lower()
+        mock_delete_chunks.assert_not_called()
 
-    @patch("src.services.recording.delete_recording_chunks")
     def test_calls_delete_recording_chunks(
         self,
         mock_delete_chunks: MagicMock,
@@ -403,8 +292,6 @@ class TestDeleteRecordingCascade:
         sample_recording: Recording,
     ) -> None:
         """Test that delete_recording_chunks is called with correct parameters."""
-        from src.services.recording import delete_recording
-
         mock_delete_chunks.return_value = 5
 
         delete_recording(
@@ -418,17 +305,16 @@ class TestDeleteRecordingCascade:
             len(call_args.args) >= 2 and call_args.args[1] == sample_recording.id
         )
 
-    @patch("src.services.recording.delete_recording_chunks")
-    def test_deletes_recording_from_database(
+    @pytest.mark.parametrize("chunks_returned", [0, 5, 10])
+    def test_deletes_recording_and_returns_true(
         self,
         mock_delete_chunks: MagicMock,
         db_session: Session,
         sample_recording: Recording,
+        chunks_returned: int,
     ) -> None:
-        """Test that recording is deleted from database."""
-        from src.services.recording import delete_recording
-
-        mock_delete_chunks.return_value = 0
+        """Test that the recording is deleted and True returned for any chunk count."""
+        mock_delete_chunks.return_value = chunks_returned
 
         recording_id = sample_recording.id
 
@@ -438,43 +324,21 @@ class TestDeleteRecordingCascade:
         )
 
         assert result is True
-        # Verify recording no longer exists
-        remaining = db_session.query(Recording).filter_by(id=recording_id).first()
-        assert remaining is None
-
-    @patch("src.services.recording.delete_recording_chunks")
-    def test_returns_true_on_successful_deletion(
-        self,
-        mock_delete_chunks: MagicMock,
-        db_session: Session,
-        sample_recording: Recording,
-    ) -> None:
-        """Test that True is returned on successful deletion."""
-        from src.services.recording import delete_recording
-
-        mock_delete_chunks.return_value = 0
-
-        result = delete_recording(
-            session=db_session,
-            recording_id=sample_recording.id,
-        )
-
-        assert result is True
+        mock_delete_chunks.assert_called_once()
+        # Verify recording no longer exists (expire so the lookup goes to the database)
+        db_session.expire_all()
+        assert db_session.get(Recording, recording_id) is None
 
-    @patch("src.services.recording.delete_recording_chunks")
     def test_deletes_transcript_via_cascade(
         self,
         mock_delete_chunks: MagicMock,
         db_session: Session,
-        sample_recording: Recording,
         sample_transcript: Transcript,
     ) -> None:
         """Test that transcript is deleted via cascade when recording is deleted."""
-        from src.services.recording import delete_recording
-
         mock_delete_chunks.return_value = 0
 
-        recording_id = sample_recording.id
+        recording_id = sample_transcript.recording_id
         transcript_id = sample_transcript.id
 
         delete_recording(
@@ -483,10 +347,9 @@ class TestDeleteRecordingCascade:
         )
 
         # Verify transcript is also deleted (cascade delete)
-        remaining_transcript = db_session.query(Transcript).filter_by(id=transcript_id).first()
-        assert remaining_transcript is None
+        db_session.expire_all()
+        assert db_session.get(Transcript, transcript_id) is None
 
-    @patch("src.services.recording.delete_recording_chunks")
     def test_delete_order_chunks_before_transcript(
         self,
         mock_delete_chunks: MagicMock,
@@ -494,85 +357,42 @@ class TestDeleteRecordingCascade:
         sample_recording: Recording,
     ) -> None:
         """Test that chunks are deleted before transcript/recording."""
-        from src.services.recording import delete_recording
-
-        call_order = []
-
-        def track_chunk_delete(*args, **kwargs):
-            call_order.append("chunks")
-            return 0
-
-        mock_delete_chunks.side_effect = track_chunk_delete
-
-        delete_recording(
-            session=db_session,
-            recording_id=sample_recording.id,
-        )
-
-        # Chunks should be deleted (call_order should contain 'chunks')
-        assert "chunks" in call_order
-
-
-class TestDeleteRecordingChunksDependency:
-    """Tests verifying the delete_recording_chunks dependency integration."""
-
-    @patch("src.services.recording.delete_recording_chunks")
-    def test_chunk_delete_count_is_logged_or_returned(
-        self,
-        mock_delete_chunks: MagicMock,
-        db_session: Session,
-        sample_recording: Recording,
-    ) -> None:
-        """Test that chunk deletion count is handled properly."""
-        from src.services.recording import delete_recording
-
-        mock_delete_chunks.return_value = 10  # 10 chunks deleted
-
-        # Should not raise, chunk count is handled internally
-        result = delete_recording(
-            session=db_session,
-            recording_id=sample_recording.id,
-        )
-
-        assert result is True
-        mock_delete_chunks.assert_called_once()
-
-    @patch("src.services.recording.delete_recording_chunks")
-    def test_chunk_delete_with_zero_chunks(
-        self,
-        mock_delete_chunks: MagicMock,
-        db_session: Session,
-        sample_recording: Recording,
-    ) -> None:
-        """Test deletion works when there are no chunks to delete."""
-        from src.services.recording import delete_recording
-
         mock_delete_chunks.return_value = 0
+        calls = MagicMock()
+        calls.attach_mock(mock_delete_chunks, "delete_chunks")
 
-        result = delete_recording(
-            session=db_session,
-            recording_id=sample_recording.id,
-        )
-
-        assert result is True
-
+        with patch.object(db_session, "delete", wraps=db_session.delete) as mock_session_delete:
+            calls.attach_mock(mock_session_delete, "session_delete")
+            delete_recording(
+                session=db_session,
+                recording_id=sample_recording.id,
+            )
 
-class TestDeleteRecordingEdgeCases:
-    """Edge case tests for delete_recording() function."""
+        mock_delete_chunks.assert_called_once()
+        assert [name for name, _, _ in calls.mock_calls] == ["delete_chunks", "session_delete"]
 
-    @patch("src.services.recording.delete_recording_chunks")
-    def test_delete_recording_with_pending_status(
+    @pytest.mark.parametrize(
+        ("status", "error_message"),
+        [
+            (ProcessingStatus.PENDING, None),
+            (ProcessingStatus.FAILED, "Processing failed due to invalid audio"),
+        ],
+    )
+    def test_delete_recording_in_any_status(
         self,
         mock_delete_chunks: MagicMock,
         db_session: Session,
-        sample_recording_pending: Recording,
+        recording_factory: Callable[..., Recording],
+        status: ProcessingStatus,
+        error_message: str | None,
     ) -> None:
-        """Test that recording with PENDING status can be deleted."""
-        from src.services.recording import delete_recording
-
+        """Test that recordings that are pending or failed can be deleted."""
         mock_delete_chunks.return_value = 0
 
-        recording_id = sample_recording_pending.id
+        recording_id = recording_factory(
+            processing_status=status.value,
+            error_message=error_message,
+        ).id
 
         result = delete_recording(
             session=db_session,
@@ -580,54 +400,9 @@ class TestDeleteRecordingEdgeCases:
         )
 
         assert result is True
-        remaining = db_session.query(Recording).filter_by(id=recording_id).first()
-        assert remaining is None
+        db_session.expire_all()
+        assert db_session.get(Recording, recording_id) is None
 
-    @patch("src.services.recording.delete_recording_chunks")
-    def test_delete_recording_with_failed_status(
-        self,
-        mock_delete_chunks: MagicMock,
-        db_session: Session,
-    ) -> None:
-        """Test that recording with FAILED status can be deleted."""
-        from src.services.recording import delete_recording
-
-        # Create a recording with FAILED status
-        recording = Recording(
-            id=str(uuid4()),
-            title="Failed Recording",
-            original_filename="failed_recording.wav",
-            volume_path="/Volumes/test/default/audio-recordings/failed.wav",
-            processing_status=ProcessingStatus.FAILED.value,
-            error_message="Processing failed due to invalid audio",
-        )
-        db_session.add(recording)
-        db_session.commit()
-
-        mock_delete_chunks.return_value = 0
-
-        result = delete_recording(
-            session=db_session,
-            recording_id=recording.id,
-        )
-
-        assert result is True
-        remaining = db_session.query(Recording).filter_by(id=recording.id).first()
-        assert remaining is None
-
-    def test_empty_recording_id_raises_value_error(self, db_session: Session) -> None:
-        """Test that empty recording_id raises ValueError."""
-        from src.services.recording import delete_recording
-
-        with pytest.raises(ValueError) as exc_info:
-            delete_recording(
-                session=db_session,
-                recording_id="",
-            )
-
-        assert "not found" in str(exc_info.value).lower()
-
-    @patch("src.services.recording.delete_recording_chunks")
     def test_chunk_deletion_error_is_raised(
         self,
         mock_delete_chunks: MagicMock,
@@ -635,14 +410,10 @@ class TestDeleteRecordingEdgeCases:
         sample_recording: Recording,
     ) -> None:
         """Test that chunk deletion errors are propagated."""
-        from src.services.recording import delete_recording
-
         mock_delete_chunks.side_effect = Exception("Database connection lost")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Database connection lost"):
             delete_recording(
                 session=db_session,
                 recording_id=sample_recording.id,
             )
-
-        assert "Database connection lost" in str(exc_info.value)
@@ -2,38 +2,55 @@
 
 from uuid import uuid4
 
+import pytest
+from sqlalchemy import inspect as sa_inspect
+
 from src.models.speaker_embedding import SpeakerEmbedding
 
+# Shared, immutable 512-dimensional vectors (the model's Vector(512) dimension)
+_VECTOR_0_1 = (0.1,) * 512
+_VECTOR_0_2 = (0.2,) * 512
+_VECTOR_0_5 = (0.5,) * 512
+
+# Mapper inspection is cached by SQLAlchemy; look the attributes up once
+_MAPPER = sa_inspect(SpeakerEmbedding)
+_ID_DEFAULT = _MAPPER.columns["id"].default
+_RECORDING_RELATIONSHIP = _MAPPER.relationships.get("recording")
+
+
+@pytest.fixture(scope="module")
+def recording_id() -> str:
+    """A recording ID shared by tests that do not need a unique one."""
+    return str(uuid4())
 
+
+@pytest.mark.usefixtures("gc_disabled")
 class TestSpeakerEmbeddingModel:
     """Tests for the SpeakerEmbedding SQLAlchemy model."""
 
-    def test_speaker_embedding_creation(self):
+    def test_speaker_embedding_creation(self, recording_id: str):
         """Test that SpeakerEmbedding can be instantiated with required fields."""
-        recording_id = str(uuid4())
-        embedding_vector = [0.1] * 512  # 512-dimensional vector
-
         embedding = SpeakerEmbedding(
             recording_id=recording_id,
             speaker_label="Interviewer",
-            embedding_vector=embedding_vector,
+            embedding_vector=_VECTOR_0_1,
         )
 
         assert embedding.recording_id == recording_id
         assert embedding.speaker_label == "Interviewer"
-        assert embedding.embedding_vector == embedding_vector
+        assert embedding.embedding_vector == _VECTOR_0_1
         assert len(embedding.embedding_vector) == 512
 
-    def test_speaker_embedding_auto_id(self):
+    def test_speaker_embedding_auto_id(self, recording_id: str):
         """Test that SpeakerEmbedding generates a UUID id if not provided."""
         embedding = SpeakerEmbedding(
-            recording_id=str(uuid4()),
+            recording_id=recording_id,
             speaker_label="Respondent",
-            embedding_vector=[0.5] * 512,
+            embedding_vector=_VECTOR_0_5,
         )
 
         # The default function should generate an ID
-        assert embedding.id is not None or hasattr(SpeakerEmbedding.id, "default")
+        assert embedding.id is not None or _ID_DEFAULT is not None
 
     def test_speaker_embedding_tablename(self):
         """Test that SpeakerEmbedding uses correct table name."""
@@ -42,40 +59,35 @@ class TestSpeakerEmbeddingModel:
     def test_speaker_embedding_has_recording_relationship(self):
         """Test that SpeakerEmbedding has a relationship to Recording."""
         # Check that the relationship is defined
-        assert hasattr(SpeakerEmbedding, "recording")
+        assert _RECORDING_RELATIONSHIP is not None
 
-    def test_speaker_embedding_embedding_vector_dimension(self):
+    def test_speaker_embedding_embedding_vector_dimension(self, recording_id: str):
         """Test embedding vector with correct dimension (512)."""
-        recording_id = str(uuid4())
-
         # 512-dimensional vector should work
         embedding = SpeakerEmbedding(
             recording_id=recording_id,
             speaker_label="Interviewer",
-            embedding_vector=[0.1] * 512,
+            embedding_vector=_VECTOR_0_1,
         )
         assert len(embedding.embedding_vector) == 512
 
-    def test_speaker_embedding_different_speaker_labels(self):
+    @pytest.mark.parametrize("label", ["Interviewer", "Respondent", "Respondent2", "Respondent3"])
+    def test_speaker_embedding_different_speaker_labels(self, recording_id: str, label: str):
         """Test SpeakerEmbedding with different speaker label values."""
-        recording_id = str(uuid4())
-        labels = ["Interviewer", "Respondent", "Respondent2", "Respondent3"]
-
-        for label in labels:
-            embedding = SpeakerEmbedding(
-                recording_id=recording_id,
-                speaker_label=label,
-                embedding_vector=[0.2] * 512,
-            )
-            assert embedding.speaker_label == label
-
-    def test_speaker_embedding_repr(self):
+        embedding = SpeakerEmbedding(
+            recording_id=recording_id,
+            speaker_label=label,
+            embedding_vector=_VECTOR_0_2,
+        )
+        assert embedding.speaker_label == label
+
+    def test_speaker_embedding_repr(self, recording_id: str):
         """Test that SpeakerEmbedding has a meaningful string representation."""
         embedding = SpeakerEmbedding(
             id="test-id",
-            recording_id=str(uuid4()),
+            recording_id=recording_id,
             speaker_label="Interviewer",
-            embedding_vector=[0.1] * 512,
+            embedding_vector=_VECTOR_0_1,
         )
 
         repr_str = repr(embedding)
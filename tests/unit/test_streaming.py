@@ -11,17 +11,57 @@ import pytest
 from src.services.streaming import stream_rag_response
 
 
+@pytest.fixture(scope="module")
+def empty_search_events() -> list[str]:
+    """SSE events streamed for a query whose similarity search finds nothing."""
+    with (
+        patch("src.services.streaming.similarity_search", return_value=[]),
+        patch("src.services.streaming.get_session", return_value=MagicMock()),
+    ):
+        return list(stream_rag_response(
+            query="test question",
+            session_id="test-session",
+        ))
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    """Database session handed out by the patched get_session."""
+    return MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def mock_search(monkeypatch: pytest.MonkeyPatch, mock_session: MagicMock) -> MagicMock:
+    """Patch the streaming module's session and search; return the search mock.
+
+    Applied to every test in this module. The search finds nothing unless a
+    test requests this fixture and sets its return_value or side_effect.
+    """
+    search = MagicMock(return_value=[])
+    monkeypatch.setattr("src.services.streaming.get_session", lambda: mock_session)
+    monkeypatch.setattr("src.services.streaming.similarity_search", search)
+    return search
+
+
+@pytest.fixture
+def stream_with_error(mock_search: MagicMock):
+    """Return a function streaming events for a query whose search raises."""
+
+    def stream(message: str = "Database connection failed") -> list[str]:
+        mock_search.side_effect = Exception(message)
+        return list(stream_rag_response(
+            query="test question",
+            session_id="test-session",
+        ))
+
+    return stream
+
+
 class TestStreamRagResponse:
     """Unit tests for stream_rag_response generator (T008 - US1)."""
 
-    @patch("src.services.streaming.similarity_search")
-    @patch("src.services.streaming.get_session")
-    def test_stream_yields_sse_formatted_strings(self, mock_get_session, mock_search):
+    def test_stream_yields_sse_formatted_strings(self):
         """Generator should yield SSE-formatted event strings."""
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-        mock_search.return_value = []
-
         events = list(stream_rag_response(
             query="test question",
             session_id="test-session",
@@ -36,38 +76,14 @@ class TestStreamRagResponse:
             # SSE events end with double newline
             assert event.endswith("\n\n")
 
-    @patch("src.services.streaming.similarity_search")
-    @patch("src.services.streaming.get_session")
-    def test_stream_ends_with_done_event(self, mock_get_session, mock_search):
+    def test_stream_ends_with_done_event(self, empty_search_events):
         """Stream should always end with a done event."""
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-        mock_search.return_value = []
-
-        events = list(stream_rag_response(
-            query="test question",
-            session_id="test-session",
-        ))
-
-        last_event = events[-1]
+        last_event = empty_search_events[-1]
         assert "event: done" in last_event
 
-    @patch("src.services.streaming.streaming_generate")
-    @patch("src.services.streaming.similarity_search")
-    @patch("src.services.streaming.get_session")
-    def test_stream_yields_token_events_from_llm(self, mock_get_session, mock_search, mock_generate):
+    def test_stream_yields_token_events_from_llm(self, empty_search_events):
         """Stream should yield token events from LLM streaming output."""
-        # Mock database session
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-
-        # Mock empty search results for simplicity
-        mock_search.return_value = []
-
-        events = list(stream_rag_response(
-            query="test question",
-            session_id="test-session",
-        ))
+        events = empty_search_events
 
         # Should have at least token and done events
         token_events = [e for e in events if "event: token" in e]
@@ -75,14 +91,8 @@ class TestStreamRagResponse:
         assert len(token_events) >= 1  # At least "no relevant info" message
         assert len(done_events) == 1
 
-    @patch("src.services.streaming.similarity_search")
-    @patch("src.services.streaming.get_session")
-    def test_stream_accepts_recording_filter(self, mock_get_session, mock_search):
+    def test_stream_accepts_recording_filter(self, mock_search):
         """Stream should accept optional recording filter."""
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-        mock_search.return_value = []
-
         # Should not raise
         events = list(stream_rag_response(
             query="test",
@@ -145,18 +155,9 @@ class TestErrorHandling:
         assert '"message": "Connection failed"' in event
         assert '"code": "GENERATION_FAILED"' in event
 
-    @patch("src.services.streaming.similarity_search")
-    @patch("src.services.streaming.get_session")
-    def test_stream_yields_error_on_exception(self, mock_get_session, mock_search):
+    def test_stream_yields_error_on_exception(self, stream_with_error):
         """Stream should yield error event when exception occurs."""
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-        mock_search.side_effect = Exception("Database connection failed")
-
-        events = list(stream_rag_response(
-            query="test question",
-            session_id="test-session",
-        ))
+        events = stream_with_error()
 
         # Should have an error event
         error_events = [e for e in events if "event: error" in e]
@@ -165,14 +166,8 @@ class TestErrorHandling:
         # Error message should contain exception info
         assert "Database connection failed" in error_events[0]
 
-    @patch("src.services.streaming.streaming_generate")
-    @patch("src.services.streaming.similarity_search")
-    @patch("src.services.streaming.get_session")
-    def test_stream_preserves_partial_on_error(self, mock_get_session, mock_search, mock_generate):
+    def test_stream_preserves_partial_on_error(self, monkeypatch, mock_search):
         """Stream should preserve partial content when error occurs mid-stream."""
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-
         # Mock a chunk with recording
         mock_chunk = MagicMock()
         mock_chunk.content = "test content"
@@ -187,7 +182,10 @@ class TestErrorHandling:
             yield " second part"
             raise Exception("LLM timeout")
 
-        mock_generate.return_value = failing_generator()
+        monkeypatch.setattr(
+            "src.services.streaming.streaming_generate",
+            lambda **_: failing_generator(),
+        )
 
         events = list(stream_rag_response(
             query="test question",
@@ -201,18 +199,9 @@ class TestErrorHandling:
         assert len(token_events) >= 1
         assert len(error_events) == 1
 
-    @patch("src.services.streaming.similarity_search")
-    @patch("src.services.streaming.get_session")
-    def test_error_event_has_code(self, mock_get_session, mock_search):
+    def test_error_event_has_code(self, stream_with_error):
         """Error event should include error code."""
-        mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
-        mock_search.side_effect = Exception("Failed")
-
-        events = list(stream_rag_response(
-            query="test question",
-            session_id="test-session",
-        ))
+        events = stream_with_error("Failed")
 
         error_events = [e for e in events if "event: error" in e]
         assert len(error_events) == 1
@@ -7,46 +7,46 @@ are written BEFORE the implementation.
 Task: T065 - Phase 5 (User Story 3 - Browse and Review Individual Recordings)
 """
 
+import pytest
+
+from src.services.transcript import highlight_matches, search_transcript, search_transcripts
+
+# Texts containing exactly one match: (text, query, start, matched text)
+SINGLE_MATCH_CASES = [
+    pytest.param("Hello, welcome to the meeting.", "welcome", 7, "welcome", id="basic"),
+    pytest.param(
+        "Hello, WELCOME to the Meeting.", "welcome", 7, "WELCOME", id="case-insensitive-text"
+    ),
+    pytest.param(
+        "Hello, welcome to the meeting.", "WELCOME", 7, "welcome", id="case-insensitive-query"
+    ),
+    pytest.param(
+        "What is the price? It costs $100.00 each.",
+        "$100.00",
+        28,
+        "$100.00",
+        id="regex-special-characters",
+    ),
+    pytest.param(
+        "[SPEAKER_00 0:00:00] Hello everyone.", "[SPEAKER_00", 0, "[SPEAKER_00", id="brackets"
+    ),
+    pytest.param("Hello, welcome to the meeting.", "Hello", 0, "Hello", id="beginning-of-text"),
+    pytest.param("Hello, welcome to the meeting", "meeting", 22, "meeting", id="end-of-text"),
+]
+
 
 class TestSearchTranscript:
     """Test cases for search_transcript() function."""
 
-    def test_basic_search_returns_match(self):
-        """Basic search should return match with start, end, and matched text."""
-        from src.services.transcript import search_transcript
-
-        text = "Hello, welcome to the meeting."
-        result = search_transcript(text, "welcome")
-
-        assert len(result) == 1
-        assert result[0]["start"] == 7
-        assert result[0]["end"] == 14
-        assert result[0]["match"] == "welcome"
-
-    def test_case_insensitive_search(self):
-        """Search should be case-insensitive."""
-        from src.services.transcript import search_transcript
+    @pytest.mark.parametrize(("text", "query", "start", "match"), SINGLE_MATCH_CASES)
+    def test_single_match(self, text, query, start, match):
+        """A single match should report its start, end, and original-case text."""
+        result = search_transcript(text, query)
 
-        text = "Hello, WELCOME to the Meeting."
-        result = search_transcript(text, "welcome")
-
-        assert len(result) == 1
-        assert result[0]["match"] == "WELCOME"
-
-    def test_case_insensitive_query_uppercase(self):
-        """Uppercase query should match lowercase text."""
-        from src.services.transcript import search_transcript
-
-        text = "Hello, welcome to the meeting."
-        result = search_transcript(text, "WELCOME")
-
-        assert len(result) == 1
-        assert result[0]["match"] == "welcome"
+        assert result == [{"start": start, "end": start + len(match), "match": match}]
 
     def test_multiple_matches_returned(self):
         """Search should return all matches when query appears multiple times."""
-        from src.services.transcript import search_transcript
-
         text = "The meeting was great. Another meeting is scheduled."
         result = search_transcript(text, "meeting")
 
@@ -58,8 +58,6 @@ class TestSearchTranscript:
 
     def test_no_matches_returns_empty_list(self):
         """Search with no matches should return empty list."""
-        from src.services.transcript import search_transcript
-
         text = "Hello, welcome to the meeting."
         result = search_transcript(text, "goodbye")
 
@@ -67,8 +65,6 @@ class TestSearchTranscript:
 
     def test_empty_query_returns_empty_list(self):
         """Empty query should return empty list."""
-        from src.services.transcript import search_transcript
-
         text = "Hello, welcome to the meeting."
         result = search_transcript(text, "")
 
@@ -76,45 +72,23 @@ class TestSearchTranscript:
 
     def test_empty_text_returns_empty_list(self):
         """Empty text should return empty list."""
-        from src.services.transcript import search_transcript
-
         result = search_transcript("", "hello")
 
         assert result == []
 
-    def test_special_characters_in_query(self):
-        """Search should handle special regex characters in query."""
-        from src.services.transcript import search_transcript
-
-        text = "What is the price? It costs $100.00 each."
-        result = search_transcript(text, "$100.00")
-
-        assert len(result) == 1
-        assert result[0]["match"] == "$100.00"
-
-    def test_special_characters_brackets(self):
-        """Search should handle bracket characters in query."""
-        from src.services.transcript import search_transcript
-
-        text = "[SPEAKER_00 0:00:00] Hello everyone."
-        result = search_transcript(text, "[SPEAKER_00")
-
-        assert len(result) == 1
-        assert result[0]["match"] == "[SPEAKER_00"
-
     def test_whitespace_query_returns_empty_list(self):
         """Whitespace-only query should return empty list."""
-        from src.services.transcript import search_transcript
-
         text = "Hello, welcome to the meeting."
         result = search_transcript(text, "   ")
 
         assert result == []
 
+    def test_whitespace_query_ignores_whitespace_in_text(self):
+        """Whitespace-only query should not match the spaces between words."""
+        assert search_transcript("Hello, welcome to the meeting.", " ") == []
+
     def test_match_positions_are_correct(self):
         """Returned positions should correctly index into original text."""
-        from src.services.transcript import search_transcript
-
         text = "The quick brown fox jumps."
         result = search_transcript(text, "brown")
 
@@ -124,31 +98,8 @@ class TestSearchTranscript:
         # Verify slicing with positions gives back the match
         assert text[start:end] == "brown"
 
-    def test_match_at_beginning_of_text(self):
-        """Search should find match at the beginning of text."""
-        from src.services.transcript import search_transcript
-
-        text = "Hello, welcome to the meeting."
-        result = search_transcript(text, "Hello")
-
-        assert len(result) == 1
-        assert result[0]["start"] == 0
-        assert result[0]["end"] == 5
-
-    def test_match_at_end_of_text(self):
-        """Search should find match at the end of text."""
-        from src.services.transcript import search_transcript
-
-        text = "Hello, welcome to the meeting"
-        result = search_transcript(text, "meeting")
-
-        assert len(result) == 1
-        assert result[0]["end"] == len(text)
-
     def test_overlapping_matches(self):
         """Search should find overlapping pattern occurrences."""
-        from src.services.transcript import search_transcript
-
         text = "aaaa"
         result = search_transcript(text, "aa")
 
@@ -160,8 +111,6 @@ class TestSearchTranscript:
 
     def test_multiline_text_search(self):
         """Search should work across multiline text."""
-        from src.services.transcript import search_transcript
-
         text = """[SPEAKER_00 0:00:00]
 Hello everyone, welcome to the meeting.
 
@@ -175,8 +124,6 @@ Thanks for having us. Let's discuss the project updates."""
 
     def test_returns_list_of_dicts(self):
         """Return type should be list[dict] with correct keys."""
-        from src.services.transcript import search_transcript
-
         text = "Hello world"
         result = search_transcript(text, "world")
 
@@ -189,8 +136,6 @@ Thanks for having us. Let's discuss the project updates."""
 
     def test_unicode_characters_in_text(self):
         """Search should handle unicode characters in text."""
-        from src.services.transcript import search_transcript
-
         text = "The cafe has great coffee."
         result = search_transcript(text, "cafe")
 
@@ -199,21 +144,41 @@ Thanks for having us. Let's discuss the project updates."""
 
     def test_unicode_characters_in_query(self):
         """Search should handle unicode characters in query."""
-        from src.services.transcript import search_transcript
-
         text = "The cafe has great coffee."
         result = search_transcript(text, "cafe")
 
         assert len(result) == 1
 
 
+class TestSearchTranscripts:
+    """Test cases for the batched search_transcripts() function."""
+
+    def test_matches_per_text_equal_search_transcript(self):
+        """Each text's matches should equal what search_transcript returns."""
+        items = [
+            ("a", "The project is on track."),
+            ("b", "No results here."),
+            ("c", "PROJECT update: project timeline"),
+            ("d", ""),
+        ]
+        result = list(search_transcripts(items, "project"))
+
+        assert [key for key, _ in result] == ["a", "b", "c", "d"]
+        for (_, text), (_, matches) in zip(items, result, strict=True):
+            assert matches == search_transcript(text, "project")
+
+    def test_whitespace_query_yields_empty_matches_for_every_key(self):
+        """A whitespace-only query should yield every key with no matches."""
+        result = list(search_transcripts([(1, "one two"), (2, "three")], "  "))
+
+        assert result == [(1, []), (2, [])]
+
+
 class TestHighlightMatches:
     """Test cases for highlight_matches() function."""
 
     def test_single_match_highlighting(self):
         """Single match should be wrapped in mark tags."""
-        from src.services.transcript import highlight_matches
-
         text = "Hello, welcome to the meeting."
         result = highlight_matches(text, "welcome")
 
@@ -221,8 +186,6 @@ class TestHighlightMatches:
 
     def test_multiple_match_highlighting(self):
         """Multiple matches should all be wrapped in mark tags."""
-        from src.services.transcript import highlight_matches
-
         text = "The meeting was great. Another meeting is scheduled."
         result = highlight_matches(text, "meeting")
 
@@ -233,8 +196,6 @@ class TestHighlightMatches:
 
     def test_case_insensitive_highlighting_preserves_case(self):
         """Highlighting should preserve original case of matched text."""
-        from src.services.transcript import highlight_matches
-
         text = "Hello, WELCOME to the Meeting."
         result = highlight_matches(text, "welcome")
 
@@ -243,8 +204,6 @@ class TestHighlightMatches:
 
     def test_case_insensitive_mixed_case_query(self):
         """Mixed case query should match and preserve original text case."""
-        from src.services.transcript import highlight_matches
-
         text = "The MEETING was about meeting prep."
         result = highlight_matches(text, "MeEtInG")
 
@@ -252,8 +211,6 @@ class TestHighlightMatches:
 
     def test_no_matches_returns_original_text(self):
         """Text with no matches should be returned unchanged."""
-        from src.services.transcript import highlight_matches
-
         text = "Hello, welcome to the meeting."
         result = highlight_matches(text, "goodbye")
 
@@ -261,8 +218,6 @@ class TestHighlightMatches:
 
     def test_empty_query_returns_original_text(self):
         """Empty query should return original text unchanged."""
-        from src.services.transcript import highlight_matches
-
         text = "Hello, welcome to the meeting."
         result = highlight_matches(text, "")
 
@@ -270,25 +225,24 @@ class TestHighlightMatches:
 
     def test_empty_text_returns_empty_string(self):
         """Empty text should return empty string."""
-        from src.services.transcript import highlight_matches
-
         result = highlight_matches("", "hello")
 
         assert result == ""
 
     def test_whitespace_query_returns_original_text(self):
         """Whitespace-only query should return original text unchanged."""
-        from src.services.transcript import highlight_matches
-
         text = "Hello, welcome to the meeting."
         result = highlight_matches(text, "   ")
 
         assert result == text
 
+    def test_whitespace_query_does_not_mark_spaces(self):
+        """Whitespace-only query should not wrap the spaces between words."""
+        text = "Hello, welcome to the meeting."
+        assert highlight_matches(text, " ") == text
+
     def test_special_characters_in_query(self):
         """Highlighting should handle special regex characters in query."""
-        from src.services.transcript import highlight_matches
-
         text = "What is the price? It costs $100.00 each."
         result = highlight_matches(text, "$100.00")
 
@@ -296,8 +250,6 @@ class TestHighlightMatches:
 
     def test_special_characters_parentheses(self):
         """Highlighting should handle parentheses in query."""
-        from src.services.transcript import highlight_matches
-
         text = "The function foo() was called."
         result = highlight_matches(text, "foo()")
 
@@ -305,8 +257,6 @@ class TestHighlightMatches:
 
     def test_match_at_beginning(self):
         """Match at beginning of text should be highlighted."""
-        from src.services.transcript import highlight_matches
-
         text = "Hello, welcome to the meeting."
         result = highlight_matches(text, "Hello")
 
@@ -314,8 +264,6 @@ class TestHighlightMatches:
 
     def test_match_at_end(self):
         """Match at end of text should be highlighted."""
-        from src.services.transcript import highlight_matches
-
         text = "Hello, welcome to the meeting"
         result = highlight_matches(text, "meeting")
 
@@ -323,8 +271,6 @@ class TestHighlightMatches:
 
     def test_multiline_text_highlighting(self):
         """Highlighting should work across multiline text."""
-        from src.services.transcript import highlight_matches
-
         text = """[SPEAKER_00 0:00:00]
 Hello everyone, welcome to the meeting.
 
@@ -337,8 +283,6 @@ Thanks for the welcome. Let's discuss."""
 
     def test_adjacent_matches(self):
         """Adjacent matches should both be highlighted."""
-        from src.services.transcript import highlight_matches
-
         text = "testtest"
         result = highlight_matches(text, "test")
 
@@ -346,16 +290,12 @@ Thanks for the welcome. Let's discuss."""
 
     def test_returns_string(self):
         """Return type should be str."""
-        from src.services.transcript import highlight_matches
-
         result = highlight_matches("Hello world", "world")
 
         assert isinstance(result, str)
 
     def test_speaker_label_highlighting(self):
         """Highlighting should work with speaker labels in transcript."""
-        from src.services.transcript import highlight_matches
-
         text = """[SPEAKER_00 0:00:00]
 Hello everyone, welcome to the meeting.
 
@@ -368,8 +308,6 @@ Thanks for having us."""
 
     def test_does_not_double_escape_html(self):
         """Existing HTML entities in text should not be affected."""
-        from src.services.transcript import highlight_matches
-
         text = "The result is &gt; 100."
         result = highlight_matches(text, "result")
 
@@ -377,8 +315,6 @@ Thanks for having us."""
 
     def test_preserves_newlines_and_whitespace(self):
         """Highlighting should preserve newlines and whitespace."""
-        from src.services.transcript import highlight_matches
-
         text = "Line one\n\nLine two  with  spaces"
         result = highlight_matches(text, "Line")
 
@@ -390,8 +326,6 @@ class TestSearchTranscriptEdgeCases:
 
     def test_very_long_text(self):
         """Search should handle very long transcripts efficiently."""
-        from src.services.transcript import search_transcript
-
         long_text = "This is a sample sentence for testing. " * 1000
         result = search_transcript(long_text, "sample")
 
@@ -399,8 +333,6 @@ class TestSearchTranscriptEdgeCases:
 
     def test_very_long_query(self):
         """Search should handle long query strings."""
-        from src.services.transcript import search_transcript
-
         long_query = "This is a very long search query that spans many words"
         text = f"Start. {long_query} End."
         result = search_transcript(text, long_query)
@@ -410,36 +342,36 @@ class TestSearchTranscriptEdgeCases:
 
     def test_none_text_returns_empty_list(self):
         """None as text should return empty list."""
-        from src.services.transcript import search_transcript
-
         result = search_transcript(None, "hello")
         assert result == []
 
     def test_none_query_returns_empty_list(self):
         """None as query should return empty list."""
-        from src.services.transcript import search_transcript
-
         result = search_transcript("Hello world", None)
         assert result == []
 
     def test_numeric_content_search(self):
         """Search should work with numeric content."""
-        from src.services.transcript import search_transcript
-
         text = "The meeting is at 10:30 AM on 2024-01-15."
         result = search_transcript(text, "10:30")
 
         assert len(result) == 1
         assert result[0]["match"] == "10:30"
 
+    def test_ascii_query_matches_unicode_case_variant(self):
+        """ASCII queries should still match Unicode case variants in non-ASCII text."""
+        text = "Cooled to 5\u212a"  # KELVIN SIGN case-folds to "k"
+        result = search_transcript(text, "k")
+
+        assert len(result) == 1
+        assert result[0]["match"] == "\u212a"
+
 
 class TestHighlightMatchesEdgeCases:
     """Edge case tests for highlight_matches() function."""
 
     def test_very_long_text(self):
         """Highlighting should handle very long transcripts."""
-        from src.services.transcript import highlight_matches
-
         long_text = "This is a sample sentence for testing. " * 1000
         result = highlight_matches(long_text, "sample")
 
@@ -447,22 +379,16 @@ class TestHighlightMatchesEdgeCases:
 
     def test_none_text_returns_none(self):
         """None as text should return None."""
-        from src.services.transcript import highlight_matches
-
         result = highlight_matches(None, "hello")
         assert result is None
 
     def test_none_query_returns_original_text(self):
         """None as query should return original text."""
-        from src.services.transcript import highlight_matches
-
         result = highlight_matches("Hello world", None)
         assert result == "Hello world"
 
     def test_text_with_existing_mark_tags(self):
         """Text with existing mark tags should not interfere with highlighting."""
-        from src.services.transcript import highlight_matches
-
         text = "This has <mark>existing</mark> marks and hello."
         result = highlight_matches(text, "hello")
 
@@ -472,8 +398,6 @@ class TestHighlightMatchesEdgeCases:
 
     def test_query_containing_mark_tag(self):
         """Query containing mark tag text should be handled safely."""
-        from src.services.transcript import highlight_matches
-
         text = "The word <mark> appears in text."
         result = highlight_matches(text, "<mark>")
 
@@ -483,28 +407,22 @@ class TestHighlightMatchesEdgeCases:
 class TestSearchTranscriptWithSampleFixture:
     """Test search_transcript with sample transcript fixture data."""
 
-    def test_search_in_diarized_content(self, sample_transcript):
+    def test_search_in_diarized_content(self, sample_transcript_text):
         """Search should work with diarized transcript content."""
-        from src.services.transcript import search_transcript
-
-        result = search_transcript(sample_transcript.diarized_text, "project")
+        result = search_transcript(sample_transcript_text.diarized_text, "project")
 
         assert len(result) >= 1
         assert any(m["match"].lower() == "project" for m in result)
 
-    def test_search_speaker_label(self, sample_transcript):
+    def test_search_speaker_label(self, sample_transcript_text):
         """Search should find speaker labels in diarized content."""
-        from src.services.transcript import search_transcript
-
-        result = search_transcript(sample_transcript.diarized_text, "SPEAKER_00")
+        result = search_transcript(sample_transcript_text.diarized_text, "SPEAKER_00")
 
         assert len(result) >= 1
 
-    def test_search_in_full_text(self, sample_transcript):
+    def test_search_in_full_text(self, sample_transcript_text):
         """Search should work with full_text transcript content."""
-        from src.services.transcript import search_transcript
-
-        result = search_transcript(sample_transcript.full_text, "meeting")
+        result = search_transcript(sample_transcript_text.full_text, "meeting")
 
         assert len(result) >= 1
 
@@ -512,19 +430,15 @@ class TestSearchTranscriptWithSampleFixture:
 class TestHighlightMatchesWithSampleFixture:
     """Test highlight_matches with sample transcript fixture data."""
 
-    def test_highlight_in_diarized_content(self, sample_transcript):
+    def test_highlight_in_diarized_content(self, sample_transcript_text):
         """Highlighting should work with diarized transcript content."""
-        from src.services.transcript import highlight_matches
-
-        result = highlight_matches(sample_transcript.diarized_text, "project")
+        result = highlight_matches(sample_transcript_text.diarized_text, "project")
 
         assert "<mark>" in result
         assert "</mark>" in result
 
-    def test_highlight_speaker_label(self, sample_transcript):
+    def test_highlight_speaker_label(self, sample_transcript_text):
         """Highlighting should work with speaker labels."""
-        from src.services.transcript import highlight_matches
-
-        result = highlight_matches(sample_transcript.diarized_text, "SPEAKER_00")
+        result = highlight_matches(sample_transcript_text.diarized_text, "SPEAKER_00")
 
         assert "<mark>SPEAKER_00</mark>" in result